@@ -0,0 +1,65 @@
+# benchmarks/bench_entity_stress.py
+"""
+Entity stress test: a big on-screen wave of sprites and placeholder outlines,
+drawn through EntityManager.draw, plain and with dirty-rect reporting.
+Run from the repo root:  python benchmarks/bench_entity_stress.py [counts...]
+"""
+
+import os
+import sys
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import pygame
+from entities import Enemy
+from entities.entity_manager import EntityManager
+
+FRAMES = 60
+VIEW = (960, 540)
+
+def _world(count):
+    rng = random.Random(11)
+    sprites = []
+    for color in ((200, 80, 80), (80, 200, 80), (80, 80, 200), (200, 200, 80)):
+        s = pygame.Surface((16, 16)).convert()
+        s.fill(color)
+        sprites.append(s)
+    manager = EntityManager()
+    for i in range(count):
+        # every fourth entity has no image and draws the outline placeholder
+        image = None if i % 4 == 0 else rng.choice(sprites)
+        manager.add(Enemy((rng.uniform(0, VIEW[0] - 32), rng.uniform(0, VIEW[1] - 32)), image))
+    manager.update(0)
+    return manager
+
+def bench(count, dirty, repeats=5):
+    """Best-of-repeats mean frame time, to keep scheduler noise out of the comparison."""
+    manager = _world(count)
+    surf = pygame.Surface(VIEW).convert()
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for _ in range(FRAMES):
+            surf.fill((0, 0, 0))
+            manager.draw(surf, (0, 0), dirty)
+        best = min(best, (time.perf_counter() - t0) / FRAMES)
+    return best
+
+def main(counts):
+    pygame.init()
+    pygame.display.set_mode(VIEW)
+    budget = 1000 / 60
+    print(f"{'entities':>8} {'draw ms':>8} {'dirty ms':>9} {'fits 60 FPS':>12}")
+    for n in counts:
+        a = bench(n, False) * 1000
+        b = bench(n, True) * 1000
+        print(f"{n:>8} {a:>8.2f} {b:>9.2f} {'yes' if max(a, b) < budget else 'no':>12}")
+    print(f"(frame budget at 60 FPS: {budget:.2f} ms; times include a surface clear)")
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [500, 2000, 5000])
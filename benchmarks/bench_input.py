@@ -0,0 +1,48 @@
+# benchmarks/bench_input.py
+"""
+Cost of controls.InputManager.update() per frame with every action bound.
+Uses the keyboard fallback path (SDL dummy driver, no joystick attached); the
+"heavy" row binds four keys to every button action, as remapping UIs allow.
+Run from the repo root:  python benchmarks/bench_input.py [frames]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+from engine import controls
+
+def _heavy_bindings():
+    spare = [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5, pygame.K_6,
+             pygame.K_7, pygame.K_8, pygame.K_9, pygame.K_0, pygame.K_z, pygame.K_x]
+    out = {}
+    for i, (action, spec) in enumerate(controls.DEFAULT_BINDINGS.items()):
+        spec = dict(spec)
+        if "kbd" in spec:
+            spec["kbd"] = list(spec["kbd"]) + [spare[(i + n) % len(spare)] for n in range(3)]
+        out[action] = spec
+    return out
+
+def bench(im, frames):
+    im.update()
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        im.update()
+    return (time.perf_counter() - t0) / frames
+
+def main(frames):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    default = bench(controls.InputManager(), frames) * 1e6
+    heavy = bench(controls.InputManager(bindings=_heavy_bindings()), frames) * 1e6
+    print(f"{'bindings':>9} {'update() us':>12}")
+    print(f"{'default':>9} {default:>12.1f}")
+    print(f"{'heavy':>9} {heavy:>12.1f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
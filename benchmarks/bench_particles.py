@@ -0,0 +1,58 @@
+# benchmarks/bench_particles.py
+"""
+Particles per frame the NumPy particle engine sustains inside a 60 FPS budget.
+Each frame runs update() + draw() on a 480x320 surface while emitters keep
+respawning to hold the live count steady.
+Run from the repo root:  python benchmarks/bench_particles.py [counts...]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+import pygame
+from engine.render.particles import ParticleEmitter
+
+FRAMES = 120
+DT = 1 / 60
+SIZE = (480, 320)
+
+def _emitter(count, **kw):
+    e = ParticleEmitter(capacity=count, gravity=(0, 40), drag=0.5, rng=np.random.default_rng(3), **kw)
+    e.emit(count, (SIZE[0] / 2, SIZE[1] / 2), life=(0.5, 1.5), jitter=40)
+    return e
+
+def bench(emitter, surf):
+    count = emitter.capacity
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        emitter.update(DT)
+        emitter.emit(count - emitter.count, (SIZE[0] / 2, SIZE[1] / 2), life=(0.5, 1.5), jitter=40)
+        surf.fill((0, 0, 0))
+        emitter.draw(surf)
+    return (time.perf_counter() - t0) / FRAMES
+
+def main(counts):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    surf = pygame.Surface(SIZE).convert()
+    dot = pygame.Surface((3, 3))
+    dot.fill((255, 180, 60))
+    budget = 1000 / 60
+    modes = (("pixels", {}), ("2px", {"size": 2}), ("additive", {"additive": True}), ("sprites", {"sprite": dot}))
+    print(f"{'particles':>9}" + "".join(f" {name + ' ms':>12} {'60 FPS':>6}" for name, _ in modes))
+    for n in counts:
+        row = f"{n:>9}"
+        for _, kw in modes:
+            ms = bench(_emitter(n, **kw), surf) * 1000
+            row += f" {ms:>12.2f} {'yes' if ms < budget else 'no':>6}"
+        print(row)
+    print(f"(frame budget at 60 FPS: {budget:.2f} ms; times include update, respawn and a surface clear)")
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1000, 5000, 20000, 50000])
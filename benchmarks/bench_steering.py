@@ -0,0 +1,77 @@
+# benchmarks/bench_steering.py
+"""
+Per-object Enemy.update seek vs. batched SteeringSystem for large drone waves.
+Run from the repo root:  python benchmarks/bench_steering.py [counts...]
+"""
+
+import os
+import sys
+import random
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+from entities import Enemy, Player
+from entities.entity_manager import EntityManager
+from entities.steering import SteeringSystem
+
+FRAMES = 120
+DT = 1 / 60
+
+class _Game:
+    pass
+
+def _spawn(manager, count, steering=None):
+    rng = random.Random(7)
+    game = _Game()
+    game.player = Player((2000, 2000))
+    manager.add(game.player)
+    for _ in range(count):
+        e = Enemy((rng.uniform(0, 4000), rng.uniform(0, 4000)))
+        if steering is not None:
+            steering.attach(e)
+        manager.add(e)
+    manager.update(0, game)
+    return game
+
+def bench_per_object(count):
+    manager = EntityManager()
+    game = _spawn(manager, count)
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        manager.update(DT, game)
+    return (time.perf_counter() - t0) / FRAMES
+
+def bench_batched(count):
+    manager = EntityManager(use_store=True, store_capacity=count + 1)
+    steering = SteeringSystem(separation_weight=0.0)
+    game = _spawn(manager, count, steering)
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        steering.update(manager, game.player.pos)
+        manager.update(DT, game)
+    return (time.perf_counter() - t0) / FRAMES
+
+def bench_batched_separation(count):
+    manager = EntityManager(use_store=True, store_capacity=count + 1)
+    steering = SteeringSystem()
+    game = _spawn(manager, count, steering)
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        steering.update(manager, game.player.pos)
+        manager.update(DT, game)
+    return (time.perf_counter() - t0) / FRAMES
+
+def main(counts):
+    budget = 1000 / 60
+    print(f"{'drones':>7} {'per-object ms':>14} {'batched ms':>11} {'batched+sep ms':>15} {'speedup':>8}")
+    for n in counts:
+        a = bench_per_object(n) * 1000
+        b = bench_batched(n) * 1000
+        c = bench_batched_separation(n) * 1000
+        print(f"{n:>7} {a:>14.2f} {b:>11.2f} {c:>15.2f} {a / b:>7.1f}x")
+    print(f"(frame budget at 60 FPS: {budget:.2f} ms; times include EntityManager.update)")
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [500, 2000, 5000])
@@ -0,0 +1,73 @@
+# engine/assets/atlas.py
+
+import json
+import os
+import time
+import pygame as pg
+
+class Atlas:
+    """
+    Runtime side of tools/pack_atlas.py. Loads the atlas pages once and hands out
+    frames as subsurfaces of them, so a frame shares the page's pixels (no copy) and
+    sprites from one atlas blit out of the same few surfaces:
+
+        atlas = Atlas.load("assets/atlas/sprites.json")
+        entity.image = atlas["enemies/drone"]
+
+    Don't draw onto frames; that would draw onto the page.
+    """
+    def __init__(self, pages, frames):
+        self.pages = pages    # [Surface]
+        self.rects = frames   # name -> (page, Rect)
+        self.frames = {}      # name -> subsurface, made on first use
+        self.load_seconds = 0.0
+
+    @classmethod
+    def load(cls, index_path):
+        return cls.finish(cls.decode(index_path))
+
+    @staticmethod
+    def decode(index_path):
+        """Parse the index and decode the pages. Safe on a worker thread; pass the result to finish()."""
+        t0 = time.perf_counter()
+        with open(index_path, encoding="utf-8") as f:
+            index = json.load(f)
+        base = os.path.dirname(index_path)
+        pages = [pg.image.load(os.path.join(base, name)) for name in index["pages"]]
+        return pages, index["frames"], time.perf_counter() - t0
+
+    @classmethod
+    def finish(cls, decoded):
+        """Convert decoded pages to the display format (main thread) and build the Atlas."""
+        pages, frames, seconds = decoded
+        t0 = time.perf_counter()
+        if pg.display.get_surface() is not None:
+            pages = [page.convert_alpha() for page in pages]
+        atlas = cls(pages, {name: (p, pg.Rect(x, y, w, h)) for name, (p, x, y, w, h) in frames.items()})
+        atlas.load_seconds = seconds + time.perf_counter() - t0
+        return atlas
+
+    def __getitem__(self, name):
+        frame = self.frames.get(name)
+        if frame is None:
+            page, rect = self.rects[name]
+            frame = self.frames[name] = self.pages[page].subsurface(rect)
+        return frame
+
+    def __contains__(self, name):
+        return name in self.rects
+
+    def names(self, prefix=""):
+        """Frame names under a prefix, sorted, e.g. names("drone/walk_") for an animation."""
+        return sorted(n for n in self.rects if n.startswith(prefix))
+
+    def stats(self):
+        page_area = sum(p.get_width() * p.get_height() for p in self.pages)
+        frame_area = sum(r.w * r.h for _, r in self.rects.values())
+        return {
+            "pages": len(self.pages),
+            "frames": len(self.rects),
+            "fill_ratio": frame_area / page_area if page_area else 0.0,
+            "bytes": sum(p.get_pitch() * p.get_height() for p in self.pages),
+            "load_seconds": self.load_seconds,
+        }
@@ -0,0 +1,201 @@
+# engine/assets/manager.py
+
+from collections import OrderedDict
+import json
+import os
+import time
+import pygame as pg
+from engine.render.fonts import get_font
+
+_DEFAULT_FONT = object()  # font(key) with no name: look the key up instead of loading
+
+class AssetManager:
+    """
+    Loads images, sounds and fonts once and hands out the cached objects by key.
+
+    Images are converted to the display format (convert / convert_alpha) when a
+    window exists. Every asset's size in bytes is tracked; once the total passes
+    budget_bytes the least recently used assets are dropped. Keys remember how they
+    were loaded, so an evicted asset is simply reloaded the next time it is asked for.
+
+    Per-level manifests (JSON in manifest_dir, named <level id>.json) list what a level
+    needs up front:
+
+        {"images": {"player": "sprites/player.png", "bg": {"path": "bg.png", "alpha": false}},
+         "sounds": {"shot": "sfx/shot.wav"},
+         "fonts":  {"hud": ["Consolas", 18]},
+         "atlases": {"sprites": "atlas/sprites.json"}}
+    """
+    def __init__(self, root="assets", manifest_dir=None, budget_bytes=64 * 1024 * 1024):
+        self.root = root
+        self.manifest_dir = manifest_dir or os.path.join(root, "manifests")
+        self.budget_bytes = budget_bytes
+        self.cache = OrderedDict()  # key -> (asset, nbytes)
+        self.specs = {}             # key -> (kind, args) used to (re)load it
+        self.bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "load_seconds": 0.0}
+
+    @classmethod
+    def from_config(cls, cfg):
+        a = cfg["assets"]
+        return cls(a["root"], a["manifest_dir"], int(a["budget_mb"] * 1024 * 1024))
+
+    def full_path(self, path):
+        # Paths may be given relative to root ("sfx/shot.wav") or already rooted
+        # ("assets/sfx/shot.wav", as older call sites pass them); only the former get root prepended.
+        if os.path.isabs(path) or os.path.normpath(path).startswith(os.path.normpath(self.root) + os.sep):
+            return path
+        return os.path.join(self.root, path)
+
+    # --- loaders: return (asset, nbytes) ---
+
+    def _load_image(self, path, alpha=True):
+        return self.finish_image(pg.image.load(self.full_path(path)), alpha)
+
+    @staticmethod
+    def finish_image(surf, alpha=True):
+        """Convert a decoded image to the display format (main thread only)."""
+        if pg.display.get_surface() is not None:
+            surf = surf.convert_alpha() if alpha else surf.convert()
+        return surf, surf.get_pitch() * surf.get_height()
+
+    def _load_sound(self, path):
+        return self.sound_entry(pg.mixer.Sound(self.full_path(path)))
+
+    @staticmethod
+    def sound_entry(snd):
+        freq, fmt, channels = pg.mixer.get_init()
+        return snd, int(snd.get_length() * freq * channels * abs(fmt) // 8)
+
+    def _load_font(self, name, size, bold=False, italic=False):
+        if isinstance(name, str) and name.lower().endswith((".ttf", ".otf")):
+            name = self.full_path(name)
+            nbytes = os.path.getsize(name)
+        else:
+            nbytes = 0  # system fonts are shared with the font registry
+        return get_font(name, size, bold, italic), nbytes
+
+    def _load_atlas(self, index_path):
+        from engine.assets.atlas import Atlas
+        return self.finish_atlas(Atlas.decode(self.full_path(index_path)))
+
+    @staticmethod
+    def finish_atlas(decoded):
+        """Build an Atlas from Atlas.decode() output (main thread only)."""
+        from engine.assets.atlas import Atlas
+        atlas = Atlas.finish(decoded)
+        return atlas, atlas.stats()["bytes"]
+
+    _LOADERS = {"image": _load_image, "sound": _load_sound, "font": _load_font, "atlas": _load_atlas}
+
+    # --- public API ---
+
+    def image(self, key, path=None, alpha=True):
+        return self._get("image", key, None if path is None else (path, alpha))
+
+    def sound(self, key, path=None):
+        return self._get("sound", key, None if path is None else (path,))
+
+    def font(self, key, name=_DEFAULT_FONT, size=16, bold=False, italic=False):
+        """name is a system font, a font file under root, or None for pygame's default."""
+        return self._get("font", key, None if name is _DEFAULT_FONT else (name, size, bold, italic))
+
+    def atlas(self, key, index_path=None):
+        """Atlas built by tools/pack_atlas.py; frames are subsurfaces of its pages."""
+        return self._get("atlas", key, None if index_path is None else (index_path,))
+
+    def get(self, key):
+        """Any cached or previously registered asset by key."""
+        if key not in self.specs:
+            raise KeyError(f"unknown asset {key!r}")
+        return self._get(self.specs[key][0], key, None)
+
+    def _get(self, kind, key, args):
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.stats["hits"] += 1
+            self.cache.move_to_end(key)
+            return entry[0]
+        if args is None:
+            if key not in self.specs:
+                raise KeyError(f"unknown {kind} {key!r}")
+            kind, args = self.specs[key]
+        t0 = time.perf_counter()
+        asset, nbytes = self._LOADERS[kind](self, *args)
+        self.stats["load_seconds"] += time.perf_counter() - t0
+        return self.insert(kind, key, args, asset, nbytes)
+
+    def insert(self, kind, key, args, asset, nbytes):
+        """Cache an asset loaded elsewhere (e.g. by a streaming loader) as if _get loaded it."""
+        self.unload(key)
+        self.specs[key] = (kind, args)
+        self.stats["misses"] += 1
+        self.cache[key] = (asset, nbytes)
+        self.bytes += nbytes
+        self._evict()
+        return asset
+
+    def cached(self, key):
+        return key in self.cache
+
+    def manifest_jobs(self, manifest):
+        """(kind, key, args) for every entry of a manifest (dict, or level id)."""
+        if not isinstance(manifest, dict):
+            manifest = self.load_manifest(manifest)
+        jobs = []
+        for key, spec in manifest.get("images", {}).items():
+            if isinstance(spec, dict):
+                jobs.append(("image", key, (spec["path"], spec.get("alpha", True))))
+            else:
+                jobs.append(("image", key, (spec, True)))
+        for key, path in manifest.get("sounds", {}).items():
+            jobs.append(("sound", key, (path,)))
+        for key, spec in manifest.get("fonts", {}).items():
+            jobs.append(("font", key, tuple(spec)))
+        for key, path in manifest.get("atlases", {}).items():
+            jobs.append(("atlas", key, (path,)))
+        return jobs
+
+    def _evict(self):
+        # Never drops the asset just loaded
+        while self.bytes > self.budget_bytes and len(self.cache) > 1:
+            _, (_, nbytes) = self.cache.popitem(last=False)
+            self.bytes -= nbytes
+            self.stats["evictions"] += 1
+
+    def unload(self, key):
+        entry = self.cache.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+    # --- manifests ---
+
+    def load_manifest(self, level_id):
+        path = os.path.join(self.manifest_dir, f"{level_id}.json")
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def preload(self, manifest):
+        """
+        Load everything a manifest (dict, or level id) lists. Returns a report:
+        {"assets", "loaded", "hits", "bytes", "seconds", "errors"}.
+        """
+        hits0, misses0 = self.stats["hits"], self.stats["misses"]
+        t0 = time.perf_counter()
+        errors = []
+        for kind, key, args in self.manifest_jobs(manifest):
+            try:
+                self._get(kind, key, args)
+            except (OSError, pg.error) as exc:  # missing/corrupt file: report, keep going
+                errors.append((key, exc))
+        hits, loaded = self.stats["hits"] - hits0, self.stats["misses"] - misses0
+        return {
+            "assets": hits + loaded,
+            "loaded": loaded,
+            "hits": hits,
+            "bytes": self.bytes,
+            "seconds": time.perf_counter() - t0,
+            "errors": errors,
+        }
@@ -0,0 +1,101 @@
+# engine/assets/streaming.py
+
+from concurrent.futures import ThreadPoolExecutor
+import io
+import os
+import time
+import pygame as pg
+from engine.assets.atlas import Atlas
+
+def _decode(kind, path):
+    """Worker thread: read and decode an image, sound or atlas (index + pages). Fonts
+    are opened on the main thread (font registry)."""
+    if kind == "atlas":
+        return Atlas.decode(path)
+    with open(path, "rb") as f:
+        data = f.read()
+    if kind == "image":
+        return pg.image.load(io.BytesIO(data), os.path.basename(path))
+    if kind == "sound":
+        return pg.mixer.Sound(file=io.BytesIO(data))
+    return None
+
+class AssetStream:
+    """
+    Loads a manifest into an AssetManager in the background. Worker threads read and
+    decode files; update() (main thread, once per frame) converts finished images and
+    atlas pages to the display format and caches them, stopping after slice_ms so frames stay smooth.
+    Assets the manager already holds are counted as done straight away.
+    """
+    def __init__(self, assets, manifest, workers=4, slice_ms=4.0):
+        self.assets = assets
+        self.slice_ms = slice_ms
+        jobs = assets.manifest_jobs(manifest)
+        self.total = len(jobs)
+        self.done = 0
+        self.errors = []  # (key, exception)
+        self.cancelled = False
+        self.started = time.perf_counter()
+        self.seconds = None  # wall time once finished
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._pending = []  # (kind, key, args, future or None), in manifest order
+        for kind, key, args in jobs:
+            if assets.cached(key):
+                self.done += 1
+                continue
+            fut = None
+            if kind in ("image", "sound", "atlas"):
+                fut = self._executor.submit(_decode, kind, assets.full_path(args[0]))
+            self._pending.append((kind, key, args, fut))
+        self._check_finished()
+
+    @property
+    def progress(self):
+        return self.done / self.total if self.total else 1.0
+
+    @property
+    def finished(self):
+        return not self._pending and not self.cancelled
+
+    def update(self):
+        """Finish decoded assets on the main thread for up to slice_ms. Returns progress."""
+        deadline = time.perf_counter() + self.slice_ms / 1000.0
+        remaining = []
+        for i, job in enumerate(self._pending):
+            if time.perf_counter() >= deadline:
+                remaining.extend(self._pending[i:])
+                break
+            kind, key, args, fut = job
+            if fut is not None and not fut.done():
+                remaining.append(job)
+                continue
+            try:
+                self._finish(kind, key, args, fut)
+            except (OSError, pg.error) as exc:  # missing/corrupt file: report it, keep loading the rest
+                self.errors.append((key, exc))
+            self.done += 1
+        self._pending = remaining
+        self._check_finished()
+        return self.progress
+
+    def _finish(self, kind, key, args, fut):
+        a = self.assets
+        if kind == "image":
+            a.insert(kind, key, args, *a.finish_image(fut.result(), args[1]))
+        elif kind == "sound":
+            a.insert(kind, key, args, *a.sound_entry(fut.result()))
+        elif kind == "atlas":
+            a.insert(kind, key, args, *a.finish_atlas(fut.result()))
+        else:
+            a.font(key, *args)
+
+    def _check_finished(self):
+        if not self._pending and self.seconds is None:
+            self.seconds = time.perf_counter() - self.started
+            self._executor.shutdown(wait=False)
+
+    def cancel(self):
+        """Stop loading: queued reads are dropped; assets already cached stay cached."""
+        self.cancelled = True
+        self._pending = []
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,54 @@
+# engine/boot/config.py
+
+import copy
+import os
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:  # pragma: no cover - older interpreters
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# Engine defaults; alpha_engine.toml only needs to list what it overrides.
+DEFAULTS = {
+    "loop": {
+        "mode": "variable",      # "variable" = raw clock dt, "fixed" = fixed-step accumulator
+        "tick_rate": 60,         # simulation steps per second in fixed mode
+        "max_steps": 5,          # spiral-of-death clamp: most steps run in one frame
+        "fps_cap": 60,           # clock.tick() cap for rendering, 0 = uncapped
+    },
+    "display": {
+        "logical_width": 480,    # resolution scenes draw at
+        "logical_height": 320,
+        "scale_mode": "letterbox",  # "integer", "letterbox" (aspect-fit) or "stretch"
+        "smooth": False,         # smoothscale instead of nearest-neighbour
+        "present": "flip",       # "flip" = whole frame, "dirty" = only reported rects
+        "dirty_threshold": 0.5,  # dirty area / logical area above which a full flip is cheaper
+        "max_dirty_rects": 16,   # more rects than this after merging -> present their union
+    },
+    "assets": {
+        "root": "assets",
+        "manifest_dir": "assets/manifests",  # <level id>.json preload lists
+        "budget_mb": 64,         # cached asset bytes before LRU eviction
+    },
+    "audio": {
+        "channels": {"ui": 2, "sfx": 12, "voice": 2},  # mixer channels reserved per category
+        "crossfade": 1.0,        # seconds for music track changes
+    },
+}
+
+def load_config(path):
+    """Read an engine TOML config merged over DEFAULTS. Missing file or no TOML parser -> defaults."""
+    cfg = copy.deepcopy(DEFAULTS)
+    if tomllib is None or not path or not os.path.exists(path):
+        return cfg
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    for section, values in data.items():
+        if isinstance(values, dict):
+            cfg.setdefault(section, {}).update(values)
+        else:
+            cfg[section] = values
+    return cfg
@@ -1,36 +1,220 @@
 # engine/display/scaler.py
 
 import pygame as pg
+from engine.boot.config import load_config
+
+# A dirty list longer than this is not worth merging; present the whole frame
+_MAX_RAW_DIRTY = 256
+
+def coalesce_rects(rects, max_rects=16, slack=1.25):
+    """
+    Merge dirty rects: overlapping or touching rects are joined, and so are pairs whose
+    union covers at most `slack` times their combined area. If more than max_rects
+    remain, their single union is returned instead.
+    """
+    out = []
+    for r in rects:
+        r = pg.Rect(r)
+        if r.w <= 0 or r.h <= 0:
+            continue
+        merged = True
+        while merged:
+            merged = False
+            for i, o in enumerate(out):
+                u = r.union(o)
+                if r.colliderect(o.inflate(2, 2)) or u.w * u.h <= (r.w * r.h + o.w * o.h) * slack:
+                    r = u
+                    out[i] = out[-1]
+                    out.pop()
+                    merged = True
+                    break
+        out.append(r)
+    if len(out) > max_rects:
+        return [out[0].unionall(out[1:])]
+    return out
 
 class Scaler:
     """
     Handles display scaling and window management.
     Converts logical game coordinates to window coordinates and vice versa.
+
+    Scenes draw into an offscreen logical-resolution target (begin()); end() scales it
+    into the window once per frame. Scale factors, the letterbox offset and the output
+    rect are recomputed only on resize, so coordinate conversion is a multiply-add.
+
+    With present = "dirty", end() presents only the logical rects passed to mark_dirty()
+    (None marks the whole frame). Nothing marked means nothing is presented. At 1x or
+    integer scales only the dirty rects are scaled; at other scales the frame is scaled
+    whole (so pixels match a full present) and only the dirty window areas are updated.
     """
     def __init__(self, config_path):
-        # Load scaling settings from config (stub)
-        self.logical_width = 480
-        self.logical_height = 320
+        cfg = load_config(config_path)["display"]
+        self.logical_width = cfg["logical_width"]
+        self.logical_height = cfg["logical_height"]
+        self.scale_mode = cfg["scale_mode"]
+        self.smooth = cfg["smooth"]
+        self.dirty_mode = cfg["present"] == "dirty"
+        self.dirty_threshold = cfg["dirty_threshold"]
+        self.max_dirty_rects = cfg["max_dirty_rects"]
+        self._dirty = []
+        self._full = True
+        self.present_stats = {"mode": "flip", "rects": 0}
         self.window = None
+        self.target = None        # logical-resolution surface scenes draw on
+        # window = logical * scale + offset; logical = (window - offset) * inv_scale
+        self.scale = (1.0, 1.0)
+        self.offset = (0, 0)
+        self.inv_scale = (1.0, 1.0)
+        self.out_rect = pg.Rect(0, 0, self.logical_width, self.logical_height)
+        self._out = None          # window subsurface covering out_rect
+        self._clear_bars = True
 
     def create_window(self):
         self.window = pg.display.set_mode((self.logical_width, self.logical_height), pg.RESIZABLE)
+        self.target = pg.Surface((self.logical_width, self.logical_height)).convert()
+        self._layout(*self.window.get_size())
         return self.window
 
     def on_resize(self, w, h):
-        # Handle window resize (stub)
         self.window = pg.display.set_mode((w, h), pg.RESIZABLE)
+        self._layout(w, h)
+
+    def _layout(self, w, h):
+        lw, lh = self.logical_width, self.logical_height
+        if self.scale_mode == "stretch":
+            sx, sy = w / lw, h / lh
+        elif self.scale_mode == "integer" and w >= lw and h >= lh:
+            sx = sy = min(w // lw, h // lh)
+        else:  # letterbox, and integer mode in a window smaller than 1x
+            sx = sy = min(w / lw, h / lh)
+        out_w, out_h = max(1, round(lw * sx)), max(1, round(lh * sy))
+        ox, oy = (w - out_w) // 2, (h - out_h) // 2
+        self.out_rect = pg.Rect(ox, oy, out_w, out_h)
+        # Use the size actually produced so conversions line up with the pixels
+        self.scale = (out_w / lw, out_h / lh)
+        self.offset = (ox, oy)
+        self.inv_scale = (lw / out_w, lh / out_h)
+        self._out = self.window.subsurface(self.out_rect.clip(self.window.get_rect()))
+        self._clear_bars = True
 
     def begin(self):
         # Return the surface to draw on
-        return self.window
+        return self.target
+
+    def _present_target(self):
+        if self._clear_bars:
+            self.window.fill((0, 0, 0))
+            self._clear_bars = False
+        if self.out_rect.size == self.target.get_size():
+            self._out.blit(self.target, (0, 0))
+        elif self.smooth:
+            pg.transform.smoothscale(self.target, self._out.get_size(), self._out)
+        else:
+            pg.transform.scale(self.target, self._out.get_size(), self._out)
+
+    def _exact_rects(self):
+        """
+        True when a logical rect maps onto whole window pixels that depend on nothing
+        outside it (1x, or an integer scale without smoothing), so it can be scaled on
+        its own. Otherwise a rect scaled alone rounds and filters differently from the
+        full frame.
+        """
+        sx, sy = self.scale
+        if (sx, sy) == (1.0, 1.0):
+            return True
+        return not self.smooth and sx.is_integer() and sy.is_integer()
+
+    def _window_rect(self, r):
+        """Window pixels a logical rect covers (in _out coordinates), or None if clipped away."""
+        sx, sy = self.scale
+        x0, y0 = int(r.left * sx), int(r.top * sy)
+        x1, y1 = -int(-r.right * sx), -int(-r.bottom * sy)  # ceil
+        out = pg.Rect(x0, y0, x1 - x0, y1 - y0)
+        if not self._exact_rects():
+            # Rounding reaches one source pixel past the rect, smoothscale's filter two
+            pad = -int(-max(sx, sy)) * (2 if self.smooth else 1) + 1
+            out.inflate_ip(2 * pad, 2 * pad)
+        out = out.clip(self._out.get_rect())
+        return out if out.w > 0 and out.h > 0 else None
+
+    def _present_rect(self, r):
+        """Scale one logical rect of the target into the window (exact scales only)."""
+        out = self._window_rect(r)
+        if out is None:
+            return None
+        sx, sy = self.scale
+        if (sx, sy) == (1.0, 1.0):
+            self._out.blit(self.target, out.topleft, r)
+        else:
+            pg.transform.scale(self.target.subsurface(r), out.size, self._out.subsurface(out))
+        return out.move(self.offset)
+
+    def mark_dirty(self, rects):
+        """Report changed logical rects for this frame; None means the whole frame."""
+        if rects is None:
+            self._full = True
+        elif not self._full:
+            self._dirty.extend(rects)
 
     def end(self):
-        # Flip/update the display
-        pg.display.flip()
-
-    def window_to_logical(self, pos):
-        # Convert window coordinates to logical game coordinates (stub)
-        x, y = pos
-        # Simple passthrough for now
-        return (x, y)
+        # Upscale the logical target into the window, then flip (or update the dirty rects)
+        full = not self.dirty_mode or self._full or self._clear_bars or len(self._dirty) > _MAX_RAW_DIRTY
+        rects = []
+        if not full:
+            bounds = self.target.get_rect()
+            rects = [r.clip(bounds) for r in coalesce_rects(self._dirty, self.max_dirty_rects)]
+            rects = [r for r in rects if r.w > 0 and r.h > 0]
+            area = sum(r.w * r.h for r in rects)
+            full = area > self.dirty_threshold * bounds.w * bounds.h
+        self._dirty = []
+        self._full = False
+
+        if full:
+            self._present_target()
+            pg.display.flip()
+            self.present_stats = {"mode": "flip", "rects": 0}
+        elif rects:
+            if self._exact_rects():
+                updated = [w for w in map(self._present_rect, rects) if w is not None]
+            else:
+                # Non-integer or smoothed scale: scale the whole frame so every pixel
+                # matches a full present, but only push the changed window areas
+                self._present_target()
+                updated = [w.move(self.offset) for w in map(self._window_rect, rects) if w is not None]
+            pg.display.update(updated)
+            self.present_stats = {"mode": "dirty", "rects": len(updated)}
+        else:
+            self.present_stats = {"mode": "skip", "rects": 0}
+
+    def window_to_logical(self, pos, clamp=False):
+        """
+        Window pixel -> logical coordinates. On the letterbox bars this is None, or with
+        clamp=True the nearest point on the edge of the logical area.
+        """
+        x = (pos[0] - self.offset[0]) * self.inv_scale[0]
+        y = (pos[1] - self.offset[1]) * self.inv_scale[1]
+        if 0 <= x < self.logical_width and 0 <= y < self.logical_height:
+            return (x, y)
+        if clamp:
+            return (min(max(x, 0.0), self.logical_width - 1.0), min(max(y, 0.0), self.logical_height - 1.0))
+        return None
+
+    def logical_to_window(self, pos):
+        return (pos[0] * self.scale[0] + self.offset[0], pos[1] * self.scale[1] + self.offset[1])
+
+    def windows_to_logical(self, points):
+        """
+        Batch window_to_logical without the bounds check. A NumPy (N, 2) array is
+        converted in one vectorized expression; any other sequence gives a list.
+        """
+        (ox, oy), (ix, iy) = self.offset, self.inv_scale
+        if hasattr(points, "shape"):
+            return (points - (ox, oy)) * (ix, iy)
+        return [((x - ox) * ix, (y - oy) * iy) for x, y in points]
+
+    def logicals_to_window(self, points):
+        """Batch logical_to_window, same conventions as windows_to_logical."""
+        (sx, sy), (ox, oy) = self.scale, self.offset
+        if hasattr(points, "shape"):
+            return points * (sx, sy) + (ox, oy)
+        return [(x * sx + ox, y * sy + oy) for x, y in points]
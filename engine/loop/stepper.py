@@ -0,0 +1,41 @@
+# engine/loop/stepper.py
+
+class FixedStepper:
+    """
+    Fixed-timestep accumulator. Each frame, advance(frame_dt) says how many
+    simulation steps of `step` seconds to run; alpha is how far the leftover time
+    is into the next step (0..1), for interpolating what gets drawn.
+    """
+    def __init__(self, tick_rate=60, max_steps=5):
+        self.step = 1.0 / tick_rate
+        self.max_steps = max(1, int(max_steps))
+        self.accumulator = 0.0
+        self.dropped = 0.0  # seconds of simulation skipped by the clamp
+
+    @classmethod
+    def from_config(cls, cfg):
+        """A stepper for cfg["loop"] in fixed mode, None for variable dt."""
+        loop = cfg.get("loop", {})
+        if loop.get("mode", "variable") != "fixed":
+            return None
+        return cls(loop.get("tick_rate", 60), loop.get("max_steps", 5))
+
+    def advance(self, frame_dt):
+        self.accumulator += frame_dt
+        steps = int(self.accumulator // self.step)
+        if steps > self.max_steps:
+            # Spiral-of-death clamp: run max_steps and drop the backlog instead of
+            # letting slow frames demand ever more steps
+            self.dropped += (steps - self.max_steps) * self.step
+            steps = self.max_steps
+            self.accumulator = self.accumulator % self.step
+        else:
+            self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.step
+
+    def reset(self):
+        self.accumulator = 0.0
@@ -0,0 +1,38 @@
+# engine/render/fonts.py
+
+import pygame as pg
+
+# Fonts the built-in scenes and overlays use; main() loads them before the first frame
+BOOT_FONTS = [
+    ("Consolas", 18),
+    ("Consolas", 28),
+    ("Consolas", 32),
+]
+
+_fonts = {}  # (name, size, bold, italic) -> pg.font.Font
+
+def get_font(name=None, size=16, bold=False, italic=False):
+    """
+    Process-wide Font registry. name is a system font name (SysFont lookup), a .ttf/.otf
+    path, or None for pygame's default font. Each (name, size, style) is loaded once.
+    """
+    key = (name.lower() if isinstance(name, str) else name, int(size), bool(bold), bool(italic))
+    font = _fonts.get(key)
+    if font is None:
+        if name is None or name.lower().endswith((".ttf", ".otf")):
+            font = pg.font.Font(name, key[1])
+            font.set_bold(key[2])
+            font.set_italic(key[3])
+        else:
+            font = pg.font.SysFont(name, key[1], key[2], key[3])
+        _fonts[key] = font
+    return font
+
+def prewarm(specs=BOOT_FONTS):
+    """Load fonts up front; specs are get_font argument tuples, e.g. ("Consolas", 28)."""
+    for spec in specs:
+        get_font(*spec)
+    return len(_fonts)
+
+def loaded_fonts():
+    return list(_fonts)
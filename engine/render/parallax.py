@@ -0,0 +1,115 @@
+# engine/render/parallax.py
+
+import numpy as np
+import pygame as pg
+
+# (star count, scroll speed px/s, (min, max) brightness, twinkle depth 0..1), far to near
+DEFAULT_LAYERS = [
+    (140, 12.0, (60, 140), 0.6),
+    (70, 35.0, (120, 200), 0.3),
+    (25, 90.0, (200, 255), 0.0),
+]
+
+class StarLayer:
+    """
+    One wrap-around star layer scrolling along axis (0 = x, 1 = y) at speed px/s.
+
+    Stars live in a NumPy table (x, y, brightness, twinkle phase/rate), not in objects.
+    The layer is pre-rendered into surfaces twice as long as the screen along the
+    scroll axis, so any scroll position is one blit of a screen-sized area. Sub-pixel
+    scrolling uses `subpixel` cached variants, each with the stars shifted by a fraction
+    of a pixel (brightness split across the two pixels they straddle); draw() picks the
+    variant for the fractional part of the offset.
+    """
+    def __init__(self, size, count, speed, brightness=(120, 255), twinkle=0.0, color=(255, 255, 255),
+                 axis=0, subpixel=4, opaque=False, rng=None):
+        rng = rng if rng is not None else np.random.default_rng()
+        self.size = w, h = size
+        self.speed = speed
+        self.axis = axis
+        self.twinkle = twinkle
+        self.subpixel = max(1, int(subpixel))
+        self.length = size[axis]
+        self.offset = 0.0
+
+        self.x = rng.integers(0, w, count)
+        self.y = rng.integers(0, h, count)
+        self.base = rng.uniform(brightness[0], brightness[1], count)
+        self.phase = rng.uniform(0.0, 2 * np.pi, count)
+        self.rate = rng.uniform(1.0, 4.0, count)  # twinkle speed, radians/s
+        self.color = np.asarray(color, dtype=np.float64) / 255.0
+
+        # Pixel coordinates each variant writes, precomputed: the star's own pixel and
+        # the one behind it along the axis, in both halves of the doubled surface
+        surf_size = (w * 2, h) if axis == 0 else (w, h * 2)
+        along = self.x if axis == 0 else self.y
+        prev = (along - 1) % self.length
+        def both_halves(a):
+            return np.concatenate([a, a + self.length])
+        if axis == 0:
+            self._px = (both_halves(self.x), both_halves(prev))
+            self._py = (np.tile(self.y, 2), np.tile(self.y, 2))
+        else:
+            self._px = (np.tile(self.x, 2), np.tile(self.x, 2))
+            self._py = (both_halves(self.y), both_halves(prev))
+
+        self.surfaces = []
+        for _ in range(self.subpixel):
+            s = pg.Surface(surf_size)
+            if pg.display.get_surface() is not None:
+                s = s.convert()
+            s.fill((0, 0, 0))
+            if not opaque:
+                s.set_colorkey((0, 0, 0))
+            self.surfaces.append(s)
+        self._paint(self.base)
+
+    def _paint(self, level):
+        """Write per-star brightness into every variant in a few vectorized stores."""
+        rgb = (level[:, None] * self.color).clip(0, 255)
+        for k, surf in enumerate(self.surfaces):
+            frac = k / self.subpixel
+            own = np.tile((rgb * (1.0 - frac)).astype(np.uint8), (2, 1))
+            behind = np.tile((rgb * frac).astype(np.uint8), (2, 1))
+            px = pg.surfarray.pixels3d(surf)
+            if frac:
+                px[self._px[1], self._py[1]] = behind
+            px[self._px[0], self._py[0]] = own
+            del px  # unlock the surface
+
+    def update(self, dt, t):
+        self.offset = (self.offset + self.speed * dt) % self.length
+        if self.twinkle > 0:
+            wave = 0.5 + 0.5 * np.sin(self.phase + self.rate * t)
+            self._paint(self.base * (1.0 - self.twinkle * wave))
+
+    def draw(self, surf):
+        whole = int(self.offset)
+        variant = self.surfaces[int((self.offset - whole) * self.subpixel)]
+        w, h = self.size
+        area = (whole, 0, w, h) if self.axis == 0 else (0, whole, w, h)
+        return surf.blit(variant, (0, 0), area)
+
+
+class Starfield:
+    """
+    Parallax background: StarLayers drawn far to near, one blit each. The farthest
+    layer is opaque, so no separate clear of the screen is needed.
+    """
+    def __init__(self, size, layers=DEFAULT_LAYERS, axis=0, subpixel=4, seed=None):
+        rng = np.random.default_rng(seed)
+        self.layers = [
+            StarLayer(size, count, speed, brightness, twinkle, axis=axis, subpixel=subpixel,
+                      opaque=(i == 0), rng=rng)
+            for i, (count, speed, brightness, twinkle) in enumerate(layers)
+        ]
+        self.time = 0.0
+
+    def update(self, dt):
+        self.time += dt
+        for layer in self.layers:
+            layer.update(dt, self.time)
+
+    def draw(self, surf):
+        for layer in self.layers:
+            layer.draw(surf)
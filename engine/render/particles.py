@@ -0,0 +1,171 @@
+# engine/render/particles.py
+
+import numpy as np
+import pygame as pg
+
+class ParticleEmitter:
+    """
+    Fixed-capacity particle pool in preallocated NumPy arrays. Live particles are
+    packed in [0:count); update() advances them all with vectorized kernels and drops
+    the dead by compacting the survivors to the front, so nothing is allocated per
+    particle. emit() past capacity spawns only what fits.
+
+    Rendering is bulk: by default particles are written straight into the target's
+    pixels through surfarray (size x size squares, colour faded by remaining life).
+    Give a sprite instead to draw pre-faded copies of it with one Surface.blits call.
+    """
+    def __init__(self, capacity=2048, gravity=(0.0, 0.0), drag=0.0, size=1, additive=False,
+                 sprite=None, fade_steps=8, rng=None):
+        self.capacity = int(capacity)
+        self.pos = np.zeros((self.capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((self.capacity, 2), dtype=np.float32)
+        self.life = np.zeros(self.capacity, dtype=np.float32)
+        self.max_life = np.ones(self.capacity, dtype=np.float32)
+        self.color = np.zeros((self.capacity, 3), dtype=np.float32)
+        self.count = 0
+        self.gravity = np.asarray(gravity, dtype=np.float32)
+        self.drag = drag
+        self.size = max(1, int(size))
+        self.additive = additive
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.sprites = self._fade_sprites(sprite, fade_steps) if sprite is not None else None
+
+    @staticmethod
+    def _fade_sprites(sprite, steps):
+        # sprites[i] is the sprite at (i + 1) / steps of full opacity
+        out = []
+        for i in range(steps):
+            s = pg.Surface(sprite.get_size(), pg.SRCALPHA)
+            s.blit(sprite, (0, 0))
+            s.fill((255, 255, 255, int(255 * (i + 1) / steps)), special_flags=pg.BLEND_RGBA_MULT)
+            out.append(s.convert_alpha() if pg.display.get_surface() is not None else s)
+        return out
+
+    def emit(self, n, pos, speed=(20.0, 80.0), angle=(0.0, 2 * np.pi), life=(0.4, 1.0),
+             color=(255, 200, 80), jitter=0.0):
+        """Spawn up to n particles at pos with random speed/angle/life ranges. Returns how many fit."""
+        n = min(int(n), self.capacity - self.count)
+        if n <= 0:
+            return 0
+        rng = self.rng
+        i0, i1 = self.count, self.count + n
+        a = rng.uniform(angle[0], angle[1], n)
+        s = rng.uniform(speed[0], speed[1], n)
+        self.pos[i0:i1] = pos
+        if jitter:
+            self.pos[i0:i1] += rng.uniform(-jitter, jitter, (n, 2))
+        self.vel[i0:i1, 0] = np.cos(a) * s
+        self.vel[i0:i1, 1] = np.sin(a) * s
+        lives = rng.uniform(life[0], life[1], n)
+        self.life[i0:i1] = lives
+        self.max_life[i0:i1] = lives
+        self.color[i0:i1] = color
+        self.count = i1
+        return n
+
+    def update(self, dt):
+        n = self.count
+        if not n:
+            return
+        vel, pos, life = self.vel[:n], self.pos[:n], self.life[:n]
+        if self.gravity.any():
+            vel += self.gravity * dt
+        if self.drag:
+            vel *= max(0.0, 1.0 - self.drag * dt)
+        pos += vel * dt
+        life -= dt
+
+        alive = life > 0
+        k = int(np.count_nonzero(alive))
+        if k == n:
+            return
+        # Compaction: boolean-index copies of the survivors into the front slots
+        for arr in (self.pos, self.vel, self.life, self.max_life, self.color):
+            arr[:k] = arr[:n][alive]
+        self.count = k
+
+    def clear(self):
+        self.count = 0
+
+    def draw(self, surf, camera=(0, 0)):
+        """Draw every live particle; returns how many landed on surf."""
+        n = self.count
+        if not n:
+            return 0
+        fade = self.life[:n] / self.max_life[:n]
+        if self.sprites is not None:
+            return self._draw_sprites(surf, camera, fade)
+
+        w, h = surf.get_size()
+        size = self.size
+        xy = (self.pos[:n] - (camera[0], camera[1])).astype(np.int32)
+        x, y = xy[:, 0], xy[:, 1]
+        on = (x >= 0) & (y >= 0) & (x <= w - size) & (y <= h - size)
+        x, y = x[on], y[on]
+        rgb = self.color[:n][on] * fade[on, None]
+        px = pg.surfarray.pixels3d(surf)
+        if self.additive:
+            self._add_pixels(px, x, y, rgb.astype(np.int32), size, h)
+        else:
+            for dx in range(size):
+                for dy in range(size):
+                    px[x + dx, y + dy] = rgb.astype(np.uint8)
+        del px  # unlock the surface
+        return len(x)
+
+    @staticmethod
+    def _add_pixels(px, x, y, rgb, size, h):
+        # Particles sharing a pixel must all add up (fancy-index assignment keeps only the
+        # last write): sum them per pixel in int32, then add the surface and saturate once.
+        offsets = [(dx, dy) for dx in range(size) for dy in range(size)]
+        key = np.concatenate([(x + dx) * h + (y + dy) for dx, dy in offsets])
+        pixels, inverse = np.unique(key, return_inverse=True)
+        acc = np.zeros((len(pixels), 3), np.int32)
+        np.add.at(acc, inverse, np.tile(rgb, (len(offsets), 1)))
+        ux, uy = np.divmod(pixels, h)
+        acc += px[ux, uy]
+        px[ux, uy] = np.minimum(acc, 255)
+
+    def _draw_sprites(self, surf, camera, fade):
+        n = self.count
+        sprites = self.sprites
+        sw, sh = sprites[0].get_size()
+        xy = (self.pos[:n] - (camera[0] + sw / 2, camera[1] + sh / 2)).astype(np.int32)
+        step = np.minimum((fade * len(sprites)).astype(np.int32), len(sprites) - 1)
+        w, h = surf.get_size()
+        x, y = xy[:, 0], xy[:, 1]
+        on = (x > -sw) & (y > -sh) & (x < w) & (y < h)
+        steps, dests = step[on].tolist(), xy[on].tolist()
+        if self.additive:
+            surf.blits([(sprites[i], d, None, pg.BLEND_RGB_ADD) for i, d in zip(steps, dests)], False)
+        else:
+            surf.blits([(sprites[i], d) for i, d in zip(steps, dests)], False)
+        return len(dests)
+
+
+class ParticleSystem:
+    """Named emitters updated and drawn together."""
+    def __init__(self):
+        self.emitters = {}
+
+    def add(self, name, emitter):
+        self.emitters[name] = emitter
+        return emitter
+
+    def __getitem__(self, name):
+        return self.emitters[name]
+
+    @property
+    def count(self):
+        return sum(e.count for e in self.emitters.values())
+
+    def update(self, dt):
+        for e in self.emitters.values():
+            e.update(dt)
+
+    def draw(self, surf, camera=(0, 0)):
+        return sum(e.draw(surf, camera) for e in self.emitters.values())
+
+    def clear(self):
+        for e in self.emitters.values():
+            e.clear()
@@ -0,0 +1,70 @@
+# engine/render/text_cache.py
+
+from collections import OrderedDict
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces keyed on (font, text, antialias, color, bg).
+    Bounded both by entry count and by total pixel bytes; the least recently used
+    surfaces are dropped first. Returned surfaces are shared, so blit them but never
+    draw onto them.
+    """
+    def __init__(self, max_entries=512, max_bytes=8 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (surface, nbytes)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias=True, color=(255, 255, 255), bg=None):
+        key = (font, text, antialias, tuple(color), tuple(bg) if bg is not None else None)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry[0]
+        self.misses += 1
+        if bg is None:
+            surf = font.render(text, antialias, color)
+        else:
+            surf = font.render(text, antialias, color, bg)
+        nbytes = surf.get_pitch() * surf.get_height()
+        self.entries[key] = (surf, nbytes)
+        self.bytes += nbytes
+        self._evict()
+        return surf
+
+    def _evict(self):
+        # Always keeps the newest entry, even if it alone is over max_bytes
+        while len(self.entries) > 1 and (len(self.entries) > self.max_entries or self.bytes > self.max_bytes):
+            _, (_, nbytes) = self.entries.popitem(last=False)
+            self.bytes -= nbytes
+            self.evictions += 1
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+# Process-wide cache shared by scenes and overlays
+TEXT_CACHE = TextCache()
+
+def render_text(font, text, antialias=True, color=(255, 255, 255), bg=None):
+    """font.render through the shared TEXT_CACHE."""
+    return TEXT_CACHE.render(font, text, antialias, color, bg)
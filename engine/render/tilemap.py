@@ -0,0 +1,153 @@
+# engine/render/tilemap.py
+
+from collections import OrderedDict
+import pygame as pg
+
+class TileMap:
+    """
+    Grid of tile ids drawn from pre-baked chunks. Each chunk_tiles x chunk_tiles block
+    is rendered once into a cached surface, so a frame costs one blit per visible chunk
+    instead of one per tile. Chunks are baked on first sight, patched in place by
+    set_tile(), and evicted least-recently-drawn first once their pixels exceed
+    budget_bytes (chunks on screen this frame are always kept).
+
+    tiles maps tile id -> Surface; ids without a surface (and `empty`) draw nothing.
+    With background set, chunks are opaque and filled with it, which blits faster.
+    """
+    def __init__(self, grid, tiles, tile_size=16, chunk_tiles=16, budget_bytes=16 * 1024 * 1024,
+                 empty=None, background=None):
+        self.grid = [list(row) for row in grid]  # [row][col]
+        self.rows = len(self.grid)
+        self.cols = max((len(r) for r in self.grid), default=0)
+        for row in self.grid:
+            row.extend([empty] * (self.cols - len(row)))
+        self.tiles = tiles
+        self.tile_size = tile_size
+        self.chunk_tiles = chunk_tiles
+        self.chunk_px = tile_size * chunk_tiles
+        self.budget_bytes = budget_bytes
+        self.empty = empty
+        self.background = background
+        self.chunks = OrderedDict()  # (cx, cy) -> (Surface, nbytes), least recently drawn first
+        self.bytes = 0
+        self.stats = {"drawn": 0, "bakes": 0, "patches": 0, "evictions": 0}
+
+    @classmethod
+    def from_rows(cls, rows, tiles, tile_size=16, empty=".", **kw):
+        """Build from strings, one character per tile, e.g. ["....#", "..##."]."""
+        return cls([list(r) for r in rows], tiles, tile_size, empty=empty, **kw)
+
+    @classmethod
+    def from_file(cls, path, tiles, tile_size=16, empty=".", **kw):
+        with open(path, encoding="utf-8") as f:
+            rows = [line.rstrip("\n") for line in f if line.strip()]
+        return cls.from_rows(rows, tiles, tile_size, empty, **kw)
+
+    @classmethod
+    def from_level(cls, level, tiles, tile_size=16, empty=".", **kw):
+        """Build from a LEVELS entry: its "tiles" rows, or a "tile_file" path."""
+        if "tiles" in level:
+            return cls.from_rows(level["tiles"], tiles, tile_size, empty, **kw)
+        if "tile_file" in level:
+            return cls.from_file(level["tile_file"], tiles, tile_size, empty, **kw)
+        raise ValueError(f"level {level.get('id')!r} has no tile grid")
+
+    @property
+    def size(self):
+        return self.cols * self.tile_size, self.rows * self.tile_size
+
+    def get_tile(self, col, row):
+        return self.grid[row][col]
+
+    def set_tile(self, col, row, tile):
+        """Change one tile; a cached chunk holding it is patched in place, not re-baked."""
+        if self.grid[row][col] == tile:
+            return
+        self.grid[row][col] = tile
+        key = (col // self.chunk_tiles, row // self.chunk_tiles)
+        entry = self.chunks.get(key)
+        if entry is None:
+            return  # baked with the new tile when it next comes into view
+        surf = entry[0]
+        ts = self.tile_size
+        x, y = (col % self.chunk_tiles) * ts, (row % self.chunk_tiles) * ts
+        surf.fill(self.background if self.background is not None else (0, 0, 0, 0), (x, y, ts, ts))
+        img = self.tiles.get(tile)
+        if img is not None:
+            surf.blit(img, (x, y))
+        self.stats["patches"] += 1
+
+    def _bake(self, cx, cy):
+        ct, ts = self.chunk_tiles, self.tile_size
+        c0, r0 = cx * ct, cy * ct
+        c1, r1 = min(c0 + ct, self.cols), min(r0 + ct, self.rows)
+        size = ((c1 - c0) * ts, (r1 - r0) * ts)
+        if self.background is not None:
+            surf = pg.Surface(size)
+            surf.fill(self.background)
+        else:
+            surf = pg.Surface(size, pg.SRCALPHA)
+        tiles, empty = self.tiles, self.empty
+        blits = []
+        for r in range(r0, r1):
+            row = self.grid[r]
+            y = (r - r0) * ts
+            for c in range(c0, c1):
+                t = row[c]
+                if t != empty:
+                    img = tiles.get(t)
+                    if img is not None:
+                        blits.append((img, ((c - c0) * ts, y)))
+        surf.blits(blits, False)
+        if pg.display.get_surface() is not None:
+            surf = surf.convert() if self.background is not None else surf.convert_alpha()
+        self.stats["bakes"] += 1
+        return surf
+
+    def _chunk(self, key):
+        entry = self.chunks.get(key)
+        if entry is None:
+            surf = self._bake(*key)
+            entry = (surf, surf.get_pitch() * surf.get_height())
+            self.chunks[key] = entry
+            self.bytes += entry[1]
+        else:
+            self.chunks.move_to_end(key)
+        return entry[0]
+
+    def _evict(self, keep):
+        # The last `keep` entries are this frame's chunks and stay regardless of budget
+        while self.bytes > self.budget_bytes and len(self.chunks) > keep:
+            _, (_, nbytes) = self.chunks.popitem(last=False)
+            self.bytes -= nbytes
+            self.stats["evictions"] += 1
+
+    def visible_chunks(self, view):
+        """Chunk keys overlapping a world-space rect."""
+        cp = self.chunk_px
+        x0, y0 = max(0, view[0] // cp), max(0, view[1] // cp)
+        x1 = min((self.cols - 1) // self.chunk_tiles, (view[0] + view[2] - 1) // cp)
+        y1 = min((self.rows - 1) // self.chunk_tiles, (view[1] + view[3] - 1) // cp)
+        return [(cx, cy) for cy in range(y0, y1 + 1) for cx in range(x0, x1 + 1)]
+
+    def draw(self, surf, camera=(0, 0)):
+        """Draw the chunks overlapping the camera view (surf-sized, at camera)."""
+        cam_x, cam_y = int(camera[0]), int(camera[1])
+        w, h = surf.get_size()
+        keys = self.visible_chunks((cam_x, cam_y, w, h))
+        cp = self.chunk_px
+        surf.blits([(self._chunk(k), (k[0] * cp - cam_x, k[1] * cp - cam_y)) for k in keys], False)
+        self._evict(len(keys))
+        self.stats["drawn"] = len(keys)
+        return len(keys)
+
+    def invalidate(self):
+        """Drop every cached chunk (e.g. after swapping the tileset)."""
+        self.chunks.clear()
+        self.bytes = 0
+
+    def to_nav_grid(self, blocked, cell_size=None):
+        """NavGrid (engine.navigation) with one cell per tile; ids in `blocked` are walls."""
+        from engine.navigation import NavGrid
+        walkable = [[t not in blocked for t in row] for row in self.grid]
+        return NavGrid(walkable, cell_size or self.tile_size)
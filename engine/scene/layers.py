@@ -0,0 +1,76 @@
+# engine/scene/layers.py
+
+import pygame as pg
+
+def _new_surface(size, alpha):
+    flags = pg.SRCALPHA if alpha else 0
+    surf = pg.Surface(size, flags)
+    if pg.display.get_surface() is not None:
+        surf = surf.convert_alpha() if alpha else surf.convert()
+    return surf
+
+class Layer:
+    """
+    A retained surface: paint(surface) runs only after invalidate(), otherwise the
+    cached pixels are reused. Alpha layers are cleared to transparent before painting;
+    opaque layers are expected to fill themselves.
+    """
+    def __init__(self, size, paint, alpha=False):
+        self.size = size
+        self.paint = paint
+        self.alpha = alpha
+        self.surface = None
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+    def render(self):
+        if self.surface is None:
+            self.surface = _new_surface(self.size, self.alpha)
+        if self.dirty:
+            if self.alpha:
+                self.surface.fill((0, 0, 0, 0))
+            self.paint(self.surface)
+            self.dirty = False
+        return self.surface
+
+class LayerStack:
+    """
+    Named layers for a scene's static content, composited bottom-up (in add() order)
+    into one cached surface. draw() puts the whole composite, or one area of it, on the
+    target with a single blit; layers are only repainted after invalidate().
+    """
+    def __init__(self, size):
+        self.size = size
+        self.layers = {}  # name -> Layer, in stacking order
+        self._composite = None
+        self._stale = True
+
+    def add(self, name, paint, alpha=False):
+        layer = Layer(self.size, paint, alpha)
+        self.layers[name] = layer
+        self._stale = True
+        return layer
+
+    def invalidate(self, name=None):
+        """Repaint one layer (or all of them with name=None) before the next draw."""
+        targets = self.layers.values() if name is None else (self.layers[name],)
+        for layer in targets:
+            layer.invalidate()
+        self._stale = True
+
+    def _rebuild(self):
+        if self._composite is None:
+            self._composite = _new_surface(self.size, False)
+        self._composite.blits([(layer.render(), (0, 0)) for layer in self.layers.values()], False)
+        self._stale = False
+
+    def draw(self, target, area=None):
+        """Blit the composite (or just area of it, in place) onto target; returns the rect drawn."""
+        if self._stale:
+            self._rebuild()
+        if area is None:
+            return target.blit(self._composite, (0, 0))
+        area = pg.Rect(area)
+        return target.blit(self._composite, area.topleft, area)
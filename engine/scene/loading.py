@@ -0,0 +1,60 @@
+# engine/scene/loading.py
+
+import pygame as pg
+from engine.render.fonts import get_font
+from engine.render.text_cache import render_text
+
+class LoadingScene:
+    """
+    Shows an AssetStream's progress while it loads, then swaps itself for the scene
+    built by next_scene_factory(). Escape / Backspace cancels the load and pops back
+    to the scene underneath (on_cancel is called if given).
+    """
+    def __init__(self, manager, stream, next_scene_factory, on_cancel=None, title="Loading"):
+        self.manager = manager
+        self.stream = stream
+        self.next_scene_factory = next_scene_factory
+        self.on_cancel = on_cancel
+        self.title = title
+        self.font = get_font("Consolas", 18)
+        self.dirty = True
+        self.shown = -1  # progress percent on screen
+        self.bar = None
+
+    def handle_event(self, event):
+        if event.type == pg.KEYDOWN and event.key in (pg.K_ESCAPE, pg.K_BACKSPACE):
+            self.stream.cancel()
+            self.manager.pop()
+            if self.on_cancel:
+                self.on_cancel()
+
+    def invalidate(self):
+        self.dirty = True
+
+    def update(self, dt):
+        if self.stream.cancelled:
+            return
+        self.stream.update()
+        if self.stream.finished:
+            self.manager.pop()
+            self.manager.push(self.next_scene_factory())
+
+    def draw(self, surface):
+        w, h = surface.get_size()
+        self.bar = pg.Rect(w // 6, h // 2, w * 2 // 3, 12)
+        percent = int(self.stream.progress * 100)
+        if not self.dirty and percent == self.shown:
+            return []
+        if self.dirty:
+            surface.fill((10, 10, 16))
+            label = render_text(self.font, self.title, True, (200, 200, 220))
+            surface.blit(label, label.get_rect(midbottom=(w // 2, self.bar.top - 8)))
+        self.shown = percent
+        pg.draw.rect(surface, (40, 40, 60), self.bar)
+        fill = self.bar.copy()
+        fill.width = self.bar.width * percent // 100
+        pg.draw.rect(surface, (120, 200, 255), fill)
+        if self.dirty:
+            self.dirty = False
+            return None  # whole screen repainted
+        return [self.bar]
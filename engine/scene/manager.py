@@ -4,16 +4,48 @@ class SceneManager:
     """
     Manages the stack of scenes (screens, states) in the game.
     Handles event dispatch, update, and drawing.
+
+    With an AssetManager, a pushed scene that has a `manifest` (level id or manifest
+    dict) gets its assets preloaded first; the report (counts, bytes, timing and any
+    load errors) lands in load_report.
     """
-    def __init__(self):
+    def __init__(self, assets=None):
         self.scenes = []
+        self._redraw_all = True
+        self.assets = assets
+        self.load_report = None
 
     def push(self, scene):
+        self._preload(scene)
         self.scenes.append(scene)
+        self._redraw_all = True
+
+    def push_loading(self, manifest, next_scene_factory, on_cancel=None, workers=4, slice_ms=4.0):
+        """
+        Stream a manifest in the background behind a LoadingScene, then replace it with
+        next_scene_factory(). Needs an AssetManager. Returns the AssetStream.
+        """
+        from engine.assets.streaming import AssetStream
+        from engine.scene.loading import LoadingScene
+        stream = AssetStream(self.assets, manifest, workers, slice_ms)
+        self.push(LoadingScene(self, stream, next_scene_factory, on_cancel))
+        return stream
+
+    def _preload(self, scene):
+        manifest = getattr(scene, "manifest", None)
+        if self.assets is None or manifest is None:
+            return
+        report = self.assets.preload(manifest)
+        report["scene"] = type(scene).__name__
+        self.load_report = report
 
     def pop(self):
         if self.scenes:
-            return self.scenes.pop()
+            scene = self.scenes.pop()
+            self._redraw_all = True
+            if self.scenes and hasattr(self.scenes[-1], "invalidate"):
+                self.scenes[-1].invalidate()  # uncovered scene has to repaint
+            return scene
         return None
 
     def handle_event(self, event):
@@ -24,6 +56,21 @@ class SceneManager:
         if self.scenes:
             self.scenes[-1].update(dt)
 
-    def draw(self, surface):
-        if self.scenes:
-            self.scenes[-1].draw(surface)
+    def draw(self, surface, alpha=1.0):
+        """
+        Draw the top scene and return its dirty rects for Scaler.mark_dirty: a list of
+        changed rects ([] = nothing changed) or None for the whole frame. Scenes that
+        return nothing count as full redraws, as does the first frame after a push/pop.
+        """
+        # alpha: fixed-step interpolation factor; scenes opt in with interpolate = True
+        if not self.scenes:
+            return None
+        scene = self.scenes[-1]
+        if getattr(scene, "interpolate", False):
+            rects = scene.draw(surface, alpha)
+        else:
+            rects = scene.draw(surface)
+        if self._redraw_all:
+            self._redraw_all = False
+            return None
+        return rects
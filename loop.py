@@ -8,16 +8,21 @@ from engine import (
     ProfilerOverlay,
     enforce_input_contract
 )
+from engine.boot.config import load_config
+from engine.loop.stepper import FixedStepper
 
 # --- Boot/Config ---
 CONFIG_PATH = "config/settings.json"  # Or wherever your config lives
 enforce_input_contract(CONFIG_PATH)
+ENGINE_CFG = load_config("alpha_engine.toml")
 
 # --- Initialize Engine Systems ---
 pg.init = ProfilerOverlay()
 scaler = Scaler(CONFIG_PATH)
 window = scaler.create_window()
 scene_manager = SceneManager()
+clock = pg.time.Clock()
+stepper = FixedStepper.from_config(ENGINE_CFG)  # None = variable dt
 
 # --- Example Scene ---
 class ExampleScene:
@@ -38,7 +43,7 @@ scene_manager.push(ExampleScene())
 # --- Main Loop ---
 RUNNING = True
 while RUNNING:
-    dt = clock.tick(60) / 1000.0  # Seconds per frame (max 60 FPS)
+    dt = clock.tick(ENGINE_CFG["loop"]["fps_cap"]) / 1000.0  # Seconds per frame
     profiler.tick(dt)
 
     # --- Event Handling ---
@@ -50,13 +55,19 @@ while RUNNING:
         if event.type == pg.VIDEORESIZE:
             scaler.on_resize(event.w, event.h)
 
-    # --- Update ---
-    scene_manager.update(dt)
+    # --- Update (fixed steps when configured) ---
+    if stepper is not None:
+        for _ in range(stepper.advance(dt)):
+            scene_manager.update(stepper.step)
+        alpha = stepper.alpha
+    else:
+        scene_manager.update(dt)
+        alpha = 1.0
     input_manager.update()  # Reset transient input states if needed
 
     # --- Draw ---
     surface = scaler.begin()
-    scene_manager.draw(surface)
+    scene_manager.draw(surface, alpha)
     input_manager.draw_controls(surface)
     profiler.draw(surface)
     scaler.end()
@@ -1,13 +1,199 @@
 # src/audio.py
 
+import io
+import time
 import pygame as pg
 
+DEFAULT_CHANNELS = {"ui": 2, "sfx": 12, "voice": 2}
+
+class SoundBank:
+    """
+    Decodes each effect once and plays it on mixer channels reserved per category.
+
+    A sound may have at most max_voices copies playing; one more steals its oldest
+    voice. When every channel of the category is busy, the lowest-priority (then
+    oldest) voice is stolen, provided it is not higher priority than the new sound;
+    otherwise the new sound is dropped. Nothing here touches the disk after load().
+    Without an initialised mixer (no audio device) the bank stays silent: load() and
+    play() return None.
+    """
+    def __init__(self, channels=DEFAULT_CHANNELS, assets=None):
+        self.assets = assets  # optional engine.assets.manager.AssetManager
+        self.sounds = {}      # key -> (Sound, category, max_voices, priority, volume)
+        self.channels = {}    # category -> [Channel]
+        self.voices = {}      # Channel -> (key, priority, started)
+        self.stats = {"played": 0, "stolen": 0, "dropped": 0}
+        self.enabled = pg.mixer.get_init() is not None
+        if not self.enabled:
+            self.channels = {category: [] for category in channels}
+            return
+        total = sum(channels.values())
+        if pg.mixer.get_num_channels() < total:
+            pg.mixer.set_num_channels(total)
+        pg.mixer.set_reserved(total)  # keep Sound.play() callers off these channels
+        index = 0
+        for category, n in channels.items():
+            self.channels[category] = [pg.mixer.Channel(i) for i in range(index, index + n)]
+            index += n
+
+    def load(self, key, path=None, category="sfx", max_voices=4, priority=0, volume=1.0):
+        """
+        Decode once. Without path the key is an asset key already known to the asset
+        manager, or a file path when the bank has none. Returns the Sound.
+        """
+        if key in self.sounds:
+            return self.sounds[key][0]
+        if category not in self.channels:
+            raise ValueError(f"unknown sound category {category!r}")
+        if not self.enabled:
+            return None
+        if self.assets is not None:
+            snd = self.assets.sound(key, path)
+        else:
+            snd = pg.mixer.Sound(path or key)
+        self.sounds[key] = (snd, category, max_voices, priority, volume)
+        return snd
+
+    def _pick_channel(self, key, category, max_voices, priority):
+        if not self.channels[category]:  # category configured with 0 channels
+            self.stats["dropped"] += 1
+            return None
+        now_playing = [(ch, v) for ch in self.channels[category]
+                       for v in (self.voices.get(ch),) if v is not None and ch.get_busy()]
+        same = [(v[2], ch) for ch, v in now_playing if v[0] == key]
+        if len(same) >= max_voices:
+            self.stats["stolen"] += 1
+            return min(same, key=lambda s: s[0])[1]  # this sound's oldest voice
+        for ch in self.channels[category]:
+            if not ch.get_busy():
+                return ch
+        # Lowest priority first, oldest among equals
+        ch, v = min(now_playing, key=lambda cv: (cv[1][1], cv[1][2]))
+        if v[1] > priority:
+            self.stats["dropped"] += 1
+            return None
+        self.stats["stolen"] += 1
+        return ch
+
+    def play(self, key, volume=None, loops=0):
+        """Play a loaded sound; returns its Channel, or None when it was dropped."""
+        if not self.enabled:
+            return None
+        snd, category, max_voices, priority, base_volume = self.sounds[key]
+        ch = self._pick_channel(key, category, max_voices, priority)
+        if ch is None:
+            return None
+        ch.play(snd, loops)
+        ch.set_volume(base_volume if volume is None else volume)
+        self.voices[ch] = (key, priority, time.perf_counter())
+        self.stats["played"] += 1
+        return ch
+
+    def stop(self, category=None):
+        for cat, chans in self.channels.items():
+            if category is None or cat == category:
+                for ch in chans:
+                    ch.stop()
+
+
+class MusicPlayer:
+    """
+    Streams music from tracks preloaded into memory (the compressed file bytes), so
+    starting a track never reads the disk. mixer.music plays one stream at a time, so a
+    crossfade ramps the current track down and the next one up over `seconds`; the ramp
+    advances in update(dt) instead of blocking like mixer.music.fadeout().
+    """
+    def __init__(self, crossfade=1.0, assets=None):
+        self.crossfade_seconds = crossfade
+        self.assets = assets  # optional AssetManager: paths resolve like sound paths
+        self.tracks = {}  # key -> bytes
+        self.current = None
+        self.volume = 0.7
+        self._fade = None  # (next_key, next_volume, elapsed, seconds)
+
+    def preload(self, key, path=None):
+        if key not in self.tracks:
+            path = path or key
+            if self.assets is not None:
+                path = self.assets.full_path(path)
+            with open(path, "rb") as f:
+                self.tracks[key] = f.read()
+
+    def _start(self, key, volume, fade_ms=0):
+        pg.mixer.music.load(io.BytesIO(self.tracks[key]))
+        pg.mixer.music.set_volume(volume)
+        pg.mixer.music.play(-1, fade_ms=fade_ms)
+        self.current, self.volume = key, volume
+
+    def play(self, key, volume=0.7, crossfade=None):
+        """Switch to a track (preloading it if needed); crossfades when one is playing."""
+        if not pg.mixer.get_init():
+            return
+        self.preload(key)
+        seconds = self.crossfade_seconds if crossfade is None else crossfade
+        if self.current is None or seconds <= 0 or not pg.mixer.music.get_busy():
+            self._fade = None
+            self._start(key, volume)
+        elif key != self.current:
+            # Retargeting a running fade keeps its progress so the volume doesn't jump
+            elapsed = self._fade[2] if self._fade is not None else 0.0
+            self._fade = (key, volume, elapsed, seconds)
+        elif self._fade is not None:
+            self._fade = None  # back to the current track before it faded out
+            pg.mixer.music.set_volume(self.volume)
+
+    def update(self, dt):
+        """Advance a running crossfade; call once per frame."""
+        if self._fade is None or not pg.mixer.get_init():
+            return
+        key, volume, elapsed, seconds = self._fade
+        elapsed += dt
+        half = seconds / 2
+        if elapsed < half:
+            pg.mixer.music.set_volume(self.volume * (1.0 - elapsed / half))
+            self._fade = (key, volume, elapsed, seconds)
+        else:
+            # Out half done: the next track fades itself in over the other half
+            self._fade = None
+            self._start(key, volume, fade_ms=int(half * 1000))
+
+    def stop(self):
+        self._fade = None
+        self.current = None
+        if pg.mixer.get_init():
+            pg.mixer.music.stop()
+
+
+_bank = None
+_music = None
+
+def configure(cfg, assets=None):
+    """Build the shared bank and music player from the engine config's [audio] section."""
+    global _bank, _music
+    _bank = SoundBank(cfg["audio"]["channels"], assets)
+    _music = MusicPlayer(cfg["audio"]["crossfade"], assets)
+
+def sound_bank():
+    """The shared SoundBank, created on first use (needs pg.mixer initialised)."""
+    global _bank
+    if _bank is None:
+        _bank = SoundBank()
+    return _bank
+
+def music_player():
+    global _music
+    if _music is None:
+        _music = MusicPlayer()
+    return _music
+
 def play_sound(path, volume=0.7):
-    snd = pg.mixer.Sound(path)
-    snd.set_volume(volume)
-    snd.play()
+    bank = sound_bank()
+    bank.load(path, path)
+    return bank.play(path, volume)
 
 def play_music(path, volume=0.7):
-    pg.mixer.music.load(path)
-    pg.mixer.music.set_volume(volume)
-    pg.mixer.music.play(-1)
+    music_player().play(path, volume)
+
+def update(dt):
+    if _music is not None:
+        _music.update(dt)
@@ -2,6 +2,8 @@
 # Sotoworks Alpha 1 Engine — Mobile-First Input Manager
 
 import pygame as pg
+from engine.render.fonts import get_font
+from engine.render.text_cache import render_text
 
 class InputManager:
     """
@@ -41,7 +43,11 @@ class InputManager:
         Returns a dict: {action: pygame.Rect}
         """
         buttons = {}
-        screen_w, screen_h = pg.display.get_surface().get_size()
+        surface = pg.display.get_surface()
+        if surface is None:
+            # No window yet (headless runs, tests): nothing to lay out
+            return buttons
+        screen_w, screen_h = surface.get_size()
         center_x, center_y = screen_w // 2, screen_h // 2
 
         def diamond(cx, cy, size):
@@ -78,6 +84,8 @@ class InputManager:
             return
         self.control_scheme = scheme
         self.virtual_buttons = self._setup_virtual_buttons()
+        if pg.font.get_init():
+            self.prewarm_fonts()  # load label fonts now, not on the next draw
         self._just_switched = True
 
     def handle_event(self, event):
@@ -101,7 +109,10 @@ class InputManager:
 
     def _process_touch(self, x, y, down):
         """Check if touch is within any virtual button zone."""
-        sx, sy = pg.display.get_surface().get_size()
+        surface = pg.display.get_surface()
+        if surface is None:
+            return
+        sx, sy = surface.get_size()
         px, py = int(x * sx), int(y * sy)
         for action, rect in self.virtual_buttons.items():
             if rect.collidepoint(px, py):
@@ -154,7 +165,7 @@ class InputManager:
         for action, rect in self.virtual_buttons.items():
             pg.draw.rect(surface, color, rect, border_radius=12)
             # Draw button label
-            font = pg.font.SysFont(None, int(rect.height * 0.7))
+            font = get_font(None, int(rect.height * 0.7))
             label = ""
             if action == 'start':
                 label = "START"
@@ -163,9 +174,14 @@ class InputManager:
             elif action in ('joystick', 'dpad'):
                 label = action.upper()
             if label:
-                txt = font.render(label, True, (40, 40, 90))
+                txt = render_text(font, label, True, (40, 40, 90))
                 surface.blit(txt, txt.get_rect(center=rect.center))
 
+    def prewarm_fonts(self):
+        """Load the label fonts draw_controls needs for the current layout."""
+        for rect in self.virtual_buttons.values():
+            get_font(None, int(rect.height * 0.7))
+
     def get_virtual_buttons(self):
         """For testing or debugging: returns a copy of the button rects."""
         return self.virtual_buttons.copy()
@@ -75,6 +75,21 @@ K_MOVE = {
     "right": [pygame.K_d, pygame.K_RIGHT],
 }
 
+# Trigger fallbacks on the keyboard (no pad attached), and the pad buttons read as L/R
+K_LEFT_TRIGGER  = (pygame.K_LCTRL,)
+K_RIGHT_TRIGGER = (pygame.K_e, pygame.K_SPACE)
+JOY_L, JOY_R = 4, 5
+
+# Button actions update() samples, in order, with the action their hold converts to
+BUTTON_ACTIONS = (
+    (A_SHOOT, None),
+    (A_MELEE, None),
+    (A_INTERACT, A_GRENADE),  # X hold = grenade
+    (A_JUMP, None),
+    (A_INVENTORY, None),
+    (A_PAUSE, None),
+)
+
 # ---------- INTERNAL HELPERS ----------
 def _now() -> float:
     return time.perf_counter()
@@ -86,12 +101,14 @@ class ButtonState:
     t_down: float = 0.0
     t_up: float = 0.0
 
-    def set(self, is_down: bool):
+    def set(self, is_down: bool, now: Optional[float] = None):
+        # now: the frame timestamp, so every change in one update() shares it
         if is_down != self.pressed:
             self.pressed = is_down
             self.changed = True
-            if is_down: self.t_down = _now()
-            else:       self.t_up   = _now()
+            if now is None: now = _now()
+            if is_down: self.t_down = now
+            else:       self.t_up   = now
         else:
             self.changed = False
 
@@ -101,8 +118,9 @@ class ButtonState:
     def was_released(self) -> bool:
         return self.changed and (not self.pressed)
 
-    def held_for(self) -> float:
-        return _now() - self.t_down if self.pressed else 0.0
+    def held_for(self, now: Optional[float] = None) -> float:
+        if not self.pressed: return 0.0
+        return (_now() if now is None else now) - self.t_down
 
 @dataclass
 class InputConfig:
@@ -128,10 +146,33 @@ class InputManager:
             j.init()
 
         self.btn: Dict[str, ButtonState] = {a: ButtonState() for a in self.bindings}
+        self.btn["_L"] = ButtonState()
+        self.btn["_R"] = ButtonState()
         self.events: list[ControlEvent] = []
         self._axis_move = (0.0, 0.0)
         self._last_r_tap_t = 0.0
         self._last_l_tap_t = 0.0
+        self.frame_time = _now()  # timestamp shared by every state change in update()
+        self._compile_bindings()
+
+    def _compile_bindings(self):
+        """
+        Flatten the binding dicts into tuples update() can scan without dict lookups:
+        one (action, state, hold action, keys, pad buttons) row per sampled button action, plus
+        the pad button indices to snapshot each frame.
+        """
+        for action in self.bindings:
+            self.btn.setdefault(action, ButtonState())
+        table = []
+        joy_used = {JOY_L, JOY_R}
+        for action, hold_name in BUTTON_ACTIONS:
+            spec = self.bindings.get(action, {})
+            keys = tuple(spec.get("kbd", ()))
+            joy = tuple(spec.get("joy_buttons", ()))
+            joy_used.update(joy)
+            table.append((action, self.btn.setdefault(action, ButtonState()), hold_name, keys, joy))
+        self._button_table = table
+        self._joy_used = max(joy_used) + 1  # snapshot buttons [0, _joy_used)
 
     # ---------- CONFIG ----------
     def save_bindings(self, path: str):
@@ -142,19 +183,27 @@ class InputManager:
             with open(path) as f:
                 data = json.load(f)
             self.bindings.update(data)
+            self._compile_bindings()
 
     # ---------- UPDATE ----------
     def update(self):
         self.events.clear()
         pygame.event.pump()
+        # One snapshot of every input source and one timestamp for the whole frame
+        now = self.frame_time = _now()
+        keys = pygame.key.get_pressed()
 
         # --- Read joystick states ---
         hat = (0,0)
+        pad = None
         if self.joys:
             j = self.joys[0]
+            n = min(self._joy_used, j.get_numbuttons())
+            pad = [j.get_button(b) for b in range(n)] + [0] * (self._joy_used - n)
             # Left stick on axes 0 (x) and 1 (y)
-            ax = j.get_axis(0) if j.get_numaxes() > 0 else 0.0
-            ay = j.get_axis(1) if j.get_numaxes() > 1 else 0.0
+            naxes = j.get_numaxes()
+            ax = j.get_axis(0) if naxes > 0 else 0.0
+            ay = j.get_axis(1) if naxes > 1 else 0.0
             # Deadzone
             ax = 0.0 if abs(ax) < self.cfg.deadzone else ax
             ay = 0.0 if abs(ay) < self.cfg.deadzone else ay
@@ -165,16 +214,15 @@ class InputManager:
                 hat = j.get_hat(0)  # (x,y) with diagonals
 
             # Triggers as buttons (typical Android pads map LB=4 RB=5; adapt if needed)
-            lb = bool(j.get_button(4))
-            rb = bool(j.get_button(5))
+            lb = bool(pad[JOY_L])
+            rb = bool(pad[JOY_R])
         else:
             # Keyboard fallback: WASD for move
-            keys = pygame.key.get_pressed()
             ax = float(keys[pygame.K_d] or keys[pygame.K_RIGHT]) - float(keys[pygame.K_a] or keys[pygame.K_LEFT])
             ay = float(keys[pygame.K_s] or keys[pygame.K_DOWN])  - float(keys[pygame.K_w] or keys[pygame.K_UP])
             self._axis_move = (ax, ay)
-            lb = keys[pygame.K_LCTRL]
-            rb = keys[pygame.K_e] or keys[pygame.K_SPACE]
+            lb = any(keys[k] for k in K_LEFT_TRIGGER)
+            rb = any(keys[k] for k in K_RIGHT_TRIGGER)
 
         # --- Move action (analog) ---
         if self._axis_move != (0.0, 0.0):
@@ -184,12 +232,7 @@ class InputManager:
         self._apply_hat(hat)
 
         # --- Map face/trigger buttons + tap/hold semantics ---
-        self._apply_button(A_SHOOT)
-        self._apply_button(A_MELEE)
-        self._apply_button(A_INTERACT, hold_name=A_GRENADE)  # X hold = grenade
-        self._apply_button(A_JUMP)
-        self._apply_button(A_INVENTORY)
-        self._apply_button(A_PAUSE)
+        self._apply_buttons(keys, pad, now)
 
         # L Trigger: crouch hold + parry tap
         self._apply_trigger_combo(left_trigger=lb, right_trigger=rb)
@@ -212,59 +255,51 @@ class InputManager:
 
     def _emit_hat(self, name: str, is_on: bool, action: str):
         st = self.btn[action]
-        st.set(is_on)
+        st.set(is_on, self.frame_time)
         if st.was_pressed():  self.events.append(ControlEvent(action, kind="press"))
         if st.was_released(): self.events.append(ControlEvent(action, kind="release"))
 
-    def _apply_button(self, action: str, hold_name: Optional[str]=None):
-        keys = pygame.key.get_pressed()
-        is_down = False
-
-        spec = self.bindings.get(action, {})
-        for k in spec.get("kbd", []):
-            if keys[k]: is_down = True
-        if self.joys:
-            j = self.joys[0]
-            for b in spec.get("joy_buttons", []):
-                if j.get_button(b): is_down = True
-
-        st = self.btn[action]
-        st.set(is_down)
+    def _apply_buttons(self, keys, pad, now: float):
+        events, hold_threshold = self.events, self.cfg.hold_threshold
+        for action, st, hold_name, kbd, joy in self._button_table:
+            is_down = any(keys[k] for k in kbd) or (pad is not None and any(pad[b] for b in joy))
+            st.set(is_down, now)
 
-        # tap
-        if st.was_pressed():
-            self.events.append(ControlEvent(action, kind="press"))
+            # tap
+            if st.changed and st.pressed:
+                events.append(ControlEvent(action, kind="press"))
 
-        # hold conversion
-        if hold_name and st.pressed and st.held_for() >= self.cfg.hold_threshold:
-            self.events.append(ControlEvent(hold_name, kind="hold"))
+            # hold conversion
+            if hold_name and st.pressed and now - st.t_down >= hold_threshold:
+                events.append(ControlEvent(hold_name, kind="hold"))
 
-        if st.was_released():
-            self.events.append(ControlEvent(action, kind="release"))
+            if st.changed and not st.pressed:
+                events.append(ControlEvent(action, kind="release"))
 
     def _apply_trigger_combo(self, left_trigger: bool, right_trigger: bool):
         # L: crouch/cover hold, or parry tap if quick
-        stL = self.btn.setdefault("_L", ButtonState())
+        now = self.frame_time
+        stL = self.btn["_L"]
         prev = stL.pressed
-        stL.set(left_trigger)
+        stL.set(left_trigger, now)
 
         if stL.was_pressed():
-            self._last_l_tap_t = _now()
+            self._last_l_tap_t = now
 
         if stL.pressed:
             # after hold threshold -> crouch/cover
-            if stL.held_for() >= self.cfg.hold_threshold:
+            if stL.held_for(now) >= self.cfg.hold_threshold:
                 self._emit_hold(A_CROUCH_COVER)
         elif prev and stL.was_released():
             # quick tap within window -> parry
-            if (_now() - self._last_l_tap_t) <= self.cfg.dodge_tap_window:
+            if (now - self._last_l_tap_t) <= self.cfg.dodge_tap_window:
                 self.events.append(ControlEvent(A_PARRY, kind="tap"))
 
         # R: rocket tap OR dodge with direction (LS + quick tap)
-        stR = self.btn.setdefault("_R", ButtonState())
-        stR.set(right_trigger)
+        stR = self.btn["_R"]
+        stR.set(right_trigger, now)
         if stR.was_pressed():
-            self._last_r_tap_t = _now()
+            self._last_r_tap_t = now
 
             # if moving significantly, treat as dodge
             ax, ay = self._axis_move
@@ -0,0 +1,235 @@
+# src/engine/input_replay.py
+"""
+Deterministic input recording and replay.
+
+InputRecorder wraps a live controls.InputManager and/or VirtualPad. The game
+keeps calling poll() / get_events() on the wrappers as usual. Every event they
+hand out is logged against the current frame index, and next_frame() is called
+once per simulation step:
+
+    rec = InputRecorder(input_manager, vpad, dt=1/60, seed=seed)
+    adapter = PlayerInputAdapter(rec.controls, rec.vpad)
+    ...each step: rec.controls.update(); ...; rec.next_frame()
+    rec.save("runs/level1.swir")
+
+ReplayInput plays a saved log back through look-alike objects (.controls / .vpad),
+one frame per advance(). headless.py --replay drives a scene from such a log under
+the recorded fixed dt and seed, and reports frame-time percentiles.
+
+File layout (little endian):
+    header  "SWIR", version u8, dt f64, seed u32, frames u32, names u16
+    names   u8 length + utf-8, repeated; actions and kinds index into this table
+    frames  frame u32, event count u16, then per event:
+            flags u8 (bit 0 = vpad event, bit 1 = has value), action u8, kind u8,
+            [x f32, y f32]
+Only frames that have events are written.
+"""
+
+import struct
+from engine.controls import ControlEvent
+
+MAGIC = b"SWIR"
+VERSION = 1
+_HEADER = struct.Struct("<4sBdIIH")
+_FRAME = struct.Struct("<IH")
+_EVENT = struct.Struct("<BBB")
+_VALUE = struct.Struct("<ff")
+F_PAD, F_VALUE = 1, 2
+
+SRC_CONTROLS, SRC_PAD = 0, 1
+
+class InputLog:
+    """
+    Recorded input: frames maps frame index -> [(source, action, kind, value)],
+    value being an (x, y) pair or None. VirtualPad events have kind "" and carry
+    their "vec" as the value.
+    """
+    def __init__(self, dt=1.0 / 60, seed=0):
+        self.dt = dt
+        self.seed = seed
+        self.frame_count = 0
+        self.frames = {}
+
+    def add(self, frame, source, action, kind="", value=None):
+        self.frames.setdefault(frame, []).append((source, action, kind, value))
+        self.frame_count = max(self.frame_count, frame + 1)
+
+    def event_count(self):
+        return sum(len(events) for events in self.frames.values())
+
+    def to_bytes(self):
+        names = {}
+        body = bytearray()
+        for frame in sorted(self.frames):
+            events = self.frames[frame]
+            body += _FRAME.pack(frame, len(events))
+            for source, action, kind, value in events:
+                flags = (F_PAD if source == SRC_PAD else 0) | (F_VALUE if value is not None else 0)
+                a = names.setdefault(action, len(names))
+                k = names.setdefault(kind, len(names))
+                if len(names) > 256:
+                    raise ValueError("input log holds at most 256 distinct action/kind names")
+                body += _EVENT.pack(flags, a, k)
+                if value is not None:
+                    body += _VALUE.pack(*value)
+        out = bytearray(_HEADER.pack(MAGIC, VERSION, self.dt, self.seed, self.frame_count, len(names)))
+        for name in names:  # insertion order == index
+            raw = name.encode("utf-8")
+            out += bytes((len(raw),)) + raw
+        return bytes(out + body)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, dt, seed, frame_count, nnames = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"not an input log (magic {magic!r}, version {version})")
+        log = cls(dt, seed)
+        pos = _HEADER.size
+        names = []
+        for _ in range(nnames):
+            n = data[pos]
+            names.append(data[pos + 1:pos + 1 + n].decode("utf-8"))
+            pos += 1 + n
+        while pos < len(data):
+            frame, count = _FRAME.unpack_from(data, pos)
+            pos += _FRAME.size
+            events = log.frames[frame] = []
+            for _ in range(count):
+                flags, a, k = _EVENT.unpack_from(data, pos)
+                pos += _EVENT.size
+                value = None
+                if flags & F_VALUE:
+                    value = _VALUE.unpack_from(data, pos)
+                    pos += _VALUE.size
+                events.append((SRC_PAD if flags & F_PAD else SRC_CONTROLS, names[a], names[k], value))
+        log.frame_count = frame_count
+        return log
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+# ---------- RECORDING ----------
+class _RecordingControls:
+    """InputManager stand-in: forwards everything, logs what poll() returns."""
+    def __init__(self, recorder, live):
+        self._recorder = recorder
+        self._live = live
+
+    def __getattr__(self, name):
+        return getattr(self._live, name)
+
+    def poll(self):
+        events = self._live.poll()
+        rec = self._recorder
+        for ce in events:
+            rec.log.add(rec.frame, SRC_CONTROLS, ce.action, ce.kind, ce.value)
+        return events
+
+class _RecordingPad:
+    """VirtualPad stand-in: forwards everything, logs what get_events() returns."""
+    def __init__(self, recorder, live):
+        self._recorder = recorder
+        self._live = live
+
+    def __getattr__(self, name):
+        return getattr(self._live, name)
+
+    def get_events(self):
+        events = self._live.get_events()
+        rec = self._recorder
+        for name, data in events:
+            rec.log.add(rec.frame, SRC_PAD, name, "", data.get("vec"))
+        return events
+
+class InputRecorder:
+    def __init__(self, input_manager=None, vpad=None, dt=1.0 / 60, seed=0):
+        self.log = InputLog(dt, seed)
+        self.frame = 0
+        self.controls = _RecordingControls(self, input_manager) if input_manager is not None else None
+        self.vpad = _RecordingPad(self, vpad) if vpad is not None else None
+
+    def next_frame(self):
+        self.frame += 1
+        self.log.frame_count = max(self.log.frame_count, self.frame)
+
+    def save(self, path):
+        self.log.save(path)
+        return self.log
+
+# ---------- REPLAY ----------
+class ReplayControls:
+    """Feeds logged ControlEvents back through the InputManager calls games use."""
+    def __init__(self):
+        self.events = []
+        self._axis_move = (0.0, 0.0)
+
+    def _load(self, events):
+        self.events = [ControlEvent(action, value, kind) for _, action, kind, value in events]
+        # InputManager emits a move axis event every frame the stick is off-centre
+        self._axis_move = next((ce.value for ce in self.events if ce.kind == "axis" and ce.action == "move"), (0.0, 0.0))
+
+    def update(self):
+        pass  # input already arrived through ReplayInput.advance()
+
+    def poll(self):
+        out = self.events[:]
+        self.events.clear()
+        return out
+
+    def move_vector(self):
+        return self._axis_move
+
+class ReplayPad:
+    """Feeds logged VirtualPad events back through get_events() / get_stick_vec()."""
+    def __init__(self):
+        self._events = []
+        self.stick_vec = (0.0, 0.0)
+
+    def _load(self, events):
+        self._events = [(name, {"vec": value} if value is not None else {}) for _, name, _, value in events]
+        # VirtualPad emits a move event every frame the stick is held
+        self.stick_vec = next((d["vec"] for name, d in self._events if name == "move"), (0.0, 0.0))
+
+    def get_events(self):
+        out = self._events.copy()
+        self._events.clear()
+        return out
+
+    def get_stick_vec(self):
+        return self.stick_vec
+
+class ReplayInput:
+    """Plays an InputLog back, one frame per advance()."""
+    def __init__(self, log):
+        self.log = log if isinstance(log, InputLog) else InputLog.load(log)
+        self.frame = -1
+        self.controls = ReplayControls()
+        self.vpad = ReplayPad()
+
+    @property
+    def finished(self):
+        return self.frame + 1 >= self.log.frame_count
+
+    def advance(self):
+        """Make the next frame's events current. Call once per simulation step, before update."""
+        self.frame += 1
+        events = self.log.frames.get(self.frame, ())
+        self.controls._load([e for e in events if e[0] == SRC_CONTROLS])
+        self.vpad._load([e for e in events if e[0] == SRC_PAD])
+
+    def attach(self, scene):
+        """Swap the replay sources into a scene that reads input through input_manager / vpad attributes."""
+        for attr, source in (("input_manager", self.controls), ("vpad", self.vpad)):
+            if hasattr(scene, attr):
+                setattr(scene, attr, source)
+        adapter = getattr(scene, "input_adapter", None)
+        if adapter is not None:
+            adapter.input_manager = self.controls
+            if getattr(adapter, "virtual_pad", None) is not None:
+                adapter.virtual_pad = self.vpad
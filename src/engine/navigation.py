@@ -0,0 +1,225 @@
+# src/engine/navigation.py
+"""
+Grid navigation for chasing enemies. One FlowField per target cell answers
+"which way to the target from here" for every walkable cell, so any number of
+enemies can sample it in O(1) instead of each running its own path search.
+
+Fields are not repaired incrementally: when the target enters a new cell nearly every
+cell's distance shifts, so FlowFieldNavigator caches whole fields per target cell and
+does a full BFS rebuild on a cache miss or after a grid edit.
+"""
+
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import math
+import numpy as np
+
+UNREACHABLE = np.iinfo(np.int32).max
+
+# 8 neighbour offsets (dx, dy) and their unit directions
+_OFFSETS = [(-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
+_UNIT = np.array([(dx / math.hypot(dx, dy), dy / math.hypot(dx, dy)) for dx, dy in _OFFSETS],
+                 dtype=np.float32)
+
+
+class NavGrid:
+    """Walkable/blocked cells over the level, cell_size pixels each."""
+    def __init__(self, walkable, cell_size=32):
+        self.walkable = np.asarray(walkable, dtype=bool)  # indexed [row, col]
+        self.rows, self.cols = self.walkable.shape
+        self.cell_size = cell_size
+        self.version = 0  # bumped on edits so cached fields know they are stale
+
+    @classmethod
+    def from_rows(cls, rows, cell_size=32, blocked="#"):
+        """Build from strings like ["....#", "..##."], any char in blocked is a wall."""
+        return cls([[ch not in blocked for ch in row] for row in rows], cell_size)
+
+    def cell_of(self, pos):
+        cs = self.cell_size
+        return int(pos[0] // cs), int(pos[1] // cs)
+
+    def in_bounds(self, cx, cy):
+        return 0 <= cx < self.cols and 0 <= cy < self.rows
+
+    def set_walkable(self, cx, cy, walkable):
+        if bool(self.walkable[cy, cx]) != bool(walkable):
+            self.walkable[cy, cx] = walkable
+            self.version += 1
+
+
+class FlowField:
+    """
+    BFS distance from every walkable cell to target_cell, plus a unit direction per
+    cell pointing at the cheapest neighbour. Diagonal steps are only allowed when
+    both adjacent cardinals are open, so enemies don't clip wall corners.
+    """
+    def __init__(self, grid, target_cell):
+        self.grid = grid
+        self.target_cell = target_cell
+        self.version = grid.version
+        self.dist = self._distances(grid, target_cell)
+        self.directions = self._directions(grid, self.dist)
+
+    @staticmethod
+    def _distances(grid, target):
+        rows, cols = grid.rows, grid.cols
+        dist = np.full((rows, cols), UNREACHABLE, dtype=np.int32)
+        tx, ty = target
+        if not grid.in_bounds(tx, ty) or not grid.walkable[ty, tx]:
+            return dist
+        # Plain-list BFS over flat indices; far cheaper than numpy item access per cell
+        open_ = grid.walkable.ravel().tolist()
+        flat = [UNREACHABLE] * (rows * cols)
+        start = ty * cols + tx
+        flat[start] = 0
+        queue = deque([start])
+        while queue:
+            i = queue.popleft()
+            d = flat[i] + 1
+            x = i % cols
+            if x > 0 and open_[i - 1] and flat[i - 1] > d:
+                flat[i - 1] = d
+                queue.append(i - 1)
+            if x < cols - 1 and open_[i + 1] and flat[i + 1] > d:
+                flat[i + 1] = d
+                queue.append(i + 1)
+            if i >= cols and open_[i - cols] and flat[i - cols] > d:
+                flat[i - cols] = d
+                queue.append(i - cols)
+            j = i + cols
+            if j < rows * cols and open_[j] and flat[j] > d:
+                flat[j] = d
+                queue.append(j)
+        dist[:] = np.asarray(flat, dtype=np.int32).reshape(rows, cols)
+        return dist
+
+    @staticmethod
+    def _directions(grid, dist):
+        rows, cols = dist.shape
+        big = np.int64(UNREACHABLE)
+        padded = np.full((rows + 2, cols + 2), big, dtype=np.int64)
+        padded[1:-1, 1:-1] = dist
+        open_pad = np.zeros((rows + 2, cols + 2), dtype=bool)
+        open_pad[1:-1, 1:-1] = grid.walkable
+
+        # Neighbour distance for each of the 8 offsets, stacked as [k, row, col]
+        nb = np.empty((8, rows, cols), dtype=np.int64)
+        for k, (dx, dy) in enumerate(_OFFSETS):
+            nd = padded[1 + dy:rows + 1 + dy, 1 + dx:cols + 1 + dx].copy()
+            if dx and dy:
+                # no corner cutting: both cardinals next to the diagonal must be open
+                ok = (open_pad[1:-1, 1 + dx:cols + 1 + dx]
+                      & open_pad[1 + dy:rows + 1 + dy, 1:-1])
+                nd[~ok] = big
+            nb[k] = nd
+        best = nb.argmin(axis=0)
+        best_d = np.take_along_axis(nb, best[None], axis=0)[0]
+
+        directions = _UNIT[best]
+        # No step if nothing nearer exists (target cell, unreachable pockets). Wall cells
+        # keep a direction out toward open ground, which un-sticks enemies clipping a wall.
+        directions[(best_d >= dist) | (best_d >= big)] = 0.0
+        return directions
+
+    def sample(self, pos):
+        """Unit (dx, dy) toward the target from pos, or None where there is no step to take."""
+        g = self.grid
+        cx, cy = int(pos[0] // g.cell_size), int(pos[1] // g.cell_size)
+        if not (0 <= cx < g.cols and 0 <= cy < g.rows):
+            return None
+        dx, dy = self.directions[cy, cx].tolist()
+        if dx == 0.0 and dy == 0.0:
+            return None
+        return dx, dy
+
+    def sample_many(self, pos):
+        """Directions for an (N, 2) array of positions; zero rows mean 'no step'."""
+        g = self.grid
+        cells = np.floor(np.asarray(pos, dtype=np.float64) / g.cell_size).astype(np.int64)
+        cx, cy = cells[:, 0], cells[:, 1]
+        inside = (cx >= 0) & (cx < g.cols) & (cy >= 0) & (cy < g.rows)
+        out = np.zeros((len(cells), 2), dtype=np.float32)
+        out[inside] = self.directions[cy[inside], cx[inside]]
+        return out
+
+
+class FlowFieldNavigator:
+    """
+    Keeps the flow field for a moving target current with cached full rebuilds. Fields
+    are cached per target cell (LRU); a field is rebuilt from scratch only when the
+    target enters a cell that isn't cached or the grid was edited. full_rebuilds counts
+    them. With threaded=True rebuilds run on a worker thread and enemies keep following
+    the previous field until the new one is ready.
+    """
+    def __init__(self, grid, cache_size=16, threaded=False):
+        self.grid = grid
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # target_cell -> FlowField
+        self.field = None
+        self.target_cell = None
+        self.full_rebuilds = 0
+        self._executor = ThreadPoolExecutor(max_workers=1) if threaded else None
+        self._pending = None  # (target_cell, future)
+
+    def set_target(self, pos):
+        """Call once per frame with the target's position (usually the player's)."""
+        self._collect()
+        cell = self.grid.cell_of(pos)
+        if cell == self.target_cell and self.field is not None and self.field.version == self.grid.version:
+            return
+        self.target_cell = cell
+
+        cached = self.cache.get(cell)
+        if cached is not None and cached.version == self.grid.version:
+            self.cache.move_to_end(cell)
+            self.field = cached
+            return
+
+        if self._executor is None:
+            self._store(self._rebuild(cell))
+        elif self._pending is None or self._pending[0] != cell:
+            self._pending = (cell, self._executor.submit(self._rebuild, cell))
+
+    def _rebuild(self, cell):
+        self.full_rebuilds += 1
+        return FlowField(self.grid, cell)
+
+    def _collect(self):
+        if self._pending is None:
+            return
+        cell, fut = self._pending
+        if fut.done():
+            self._pending = None
+            field = fut.result()
+            if field.version == self.grid.version:
+                self._store(field, adopt=(cell == self.target_cell))
+
+    def _store(self, field, adopt=True):
+        self.cache[field.target_cell] = field
+        self.cache.move_to_end(field.target_cell)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        if adopt:
+            self.field = field
+
+    def invalidate(self):
+        """Drop cached fields (after editing the grid) and rebuild for the current target."""
+        self.cache.clear()
+        if self.target_cell is not None:
+            cs = self.grid.cell_size
+            tx, ty = self.target_cell
+            self.target_cell = None
+            self.set_target((tx * cs, ty * cs))
+
+    def sample(self, pos):
+        return self.field.sample(pos) if self.field is not None else None
+
+    def sample_many(self, pos):
+        if self.field is None:
+            return np.zeros((len(pos), 2), dtype=np.float32)
+        return self.field.sample_many(pos)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
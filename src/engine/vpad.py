@@ -2,9 +2,30 @@
 
 import pygame, math, time, json
 
-def _dist(x1, y1, x2, y2): return math.hypot(x2 - x1, y2 - y1)
 def _now(): return time.perf_counter()
 
+def _finish(s):
+    # convert_alpha needs a display; headless runs keep the plain SRCALPHA surface
+    return s.convert_alpha() if pygame.display.get_surface() is not None else s
+
+def _faded(img, opacity):
+    """Copy of img with its per-pixel alpha scaled by opacity (0-255), baked in."""
+    s = pygame.Surface(img.get_size(), pygame.SRCALPHA)
+    s.blit(img, (0, 0))
+    s.fill((255, 255, 255, opacity), special_flags=pygame.BLEND_RGBA_MULT)
+    return _finish(s)
+
+def _circle(color, radius, width=0):
+    r = max(1, int(radius))
+    s = pygame.Surface((r * 2 + 1, r * 2 + 1), pygame.SRCALPHA)
+    pygame.draw.circle(s, color, (r, r), r, width)
+    return _finish(s)
+
+def _round_rect(color, w, h):
+    s = pygame.Surface((max(1, int(w)), max(1, int(h))), pygame.SRCALPHA)
+    pygame.draw.rect(s, color, s.get_rect(), border_radius=10)
+    return _finish(s)
+
 class VirtualPad:
     def __init__(self, cfg, screen_w, screen_h, assets=None):
         self.cfg = cfg["vpad"]
@@ -13,6 +34,22 @@ class VirtualPad:
         self.opacity_idle = int(self.cfg.get("opacity_idle", 0.65) * 255)
         self.opacity_active = int(self.cfg.get("opacity_active", 0.9) * 255)
 
+        # Cached blit list for the whole pad, rebuilt only when what it shows changes
+        self._blits = []
+        self._blits_key = None
+        self._shown = None  # blit list last put on a retained surface (draw with background)
+        self.rebuilds = 0
+        self._layout()
+        self._bake()
+
+        # State
+        self.stick_touch = None
+        self.stick_vec = (0.0, 0.0)
+        self.btn_touches = {}  # tid: {btn: down_time}
+        self.btn_states = {k: False for k in self.btn_defs}
+        self._events = []
+
+    def _layout(self):
         # Stick
         st = self.cfg["stick"]
         self.st_c = (self.w * st["cx"], self.h * st["cy"])
@@ -34,75 +71,159 @@ class VirtualPad:
                         self.h * v["h"],
                     ),
                 )
+        self._build_hit_grid()
 
-        # State
-        self.stick_touch = None
-        self.stick_vec = (0.0, 0.0)
-        self.btn_touches = {}  # tid: (btn, down_time)
-        self.btn_states = {k: False for k in self.btn_defs}
-        self._events = []
+    def _build_hit_grid(self):
+        """
+        Bucket the buttons into a coarse grid of screen cells, so a touch is only tested
+        against the buttons overlapping its cell. Each candidate is stored ready to test:
+        ("circle", cx, cy, r*r) or ("rect", x0, y0, x1, y1).
+        """
+        self.r_out_sq = self.r_out * self.r_out
+        self._cell = max(8, int(min(self.w, self.h) // 8))
+        self._cols = int(self.w // self._cell) + 1
+        self._rows = int(self.h // self._cell) + 1
+        grid = [[] for _ in range(self._cols * self._rows)]
+        for name, (kind, data) in self.btn_defs.items():
+            if kind == "circle":
+                cx, cy, r = data
+                test = (name, kind, cx, cy, r * r, 0.0)
+                x0, y0, x1, y1 = cx - r, cy - r, cx + r, cy + r
+            else:
+                rx, ry, rw, rh = data
+                x0, y0, x1, y1 = rx, ry, rx + rw, ry + rh
+                test = (name, kind, x0, y0, x1, y1)
+            c0, c1 = self._grid_col(x0), self._grid_col(x1)
+            for row in range(self._grid_row(y0), self._grid_row(y1) + 1):
+                for col in range(c0, c1 + 1):
+                    grid[row * self._cols + col].append(test)
+        self._hit_grid = [tuple(cell) for cell in grid]
+
+    def _grid_col(self, x): return min(self._cols - 1, max(0, int(x // self._cell)))
+    def _grid_row(self, y): return min(self._rows - 1, max(0, int(y // self._cell)))
+
+    def hit_buttons(self, x, y):
+        """Names of the buttons under a screen point, in layout order."""
+        if not (0 <= x < self._cols * self._cell and 0 <= y < self._rows * self._cell):
+            return []
+        hits = []
+        for name, kind, a, b, c, d in self._hit_grid[int(y // self._cell) * self._cols + int(x // self._cell)]:
+            if kind == "circle":
+                dx, dy = x - a, y - b
+                if dx * dx + dy * dy <= c:
+                    hits.append(name)
+            elif a <= x <= c and b <= y <= d:
+                hits.append(name)
+        return hits
+
+    def _bake(self):
+        """
+        Pre-render every control once per layout: idle/active variants of the stick ring
+        and knob, idle/active/pressed variants of each button, as alpha surfaces with the
+        opacity baked in.
+        """
+        idle, active = self.opacity_idle, self.opacity_active
+        outer, inner = self.assets.get("stick_outer"), self.assets.get("stick_inner")
+        if outer:
+            self.stick_outer = {False: _faded(outer, idle), True: _faded(outer, active)}
+        else:
+            self.stick_outer = {False: _circle((80,120,180,idle), self.r_out, 4),
+                                True: _circle((80,120,180,active), self.r_out, 4)}
+        if inner:
+            self.stick_inner = {False: _faded(inner, idle), True: _faded(inner, active)}
+        else:
+            self.stick_inner = {False: _circle((128,220,255,idle), self.r_in),
+                                True: _circle((128,220,255,active), self.r_in)}
+
+        self.btn_imgs = {}   # name -> {"idle"|"active"|"pressed": Surface}
+        self.btn_rects = {}  # name -> screen rect the button image covers
+        for name, (kind, data) in self.btn_defs.items():
+            img = self.assets.get(f"btn_{name.lower()}")
+            if img:
+                variants = {"idle": _faded(img, idle), "active": _faded(img, active), "pressed": _faded(img, active)}
+            elif kind == "circle":
+                variants = {"idle": _circle((80,80,190,idle), data[2]), "active": _circle((80,80,190,active), data[2]),
+                            "pressed": _circle((190,80,80,active), data[2])}
+            else:
+                variants = {"idle": _round_rect((80,80,190,idle), data[2], data[3]),
+                            "active": _round_rect((80,80,190,active), data[2], data[3]),
+                            "pressed": _round_rect((190,80,80,active), data[2], data[3])}
+            self.btn_imgs[name] = variants
+            if kind == "circle":
+                center = (data[0], data[1])
+            else:
+                center = (data[0] + data[2]/2, data[1] + data[3]/2)
+            self.btn_rects[name] = variants["idle"].get_rect(center=center)
+
+        self._blits_key = None
+        self._shown = None
+
+    def invalidate(self):
+        """Make the next draw(..., background) repaint every control."""
+        self._shown = None
+
+    def resize(self, screen_w, screen_h):
+        """Re-layout and re-bake the controls for a new screen size."""
+        self.w, self.h = screen_w, screen_h
+        self._layout()
+        self._bake()
 
     def on_touch(self, touches):
         now = _now()
         self._events.clear()
+        down = {tid: (x, y) for tid, x, y, dn in touches if dn}
         # --- Stick logic ---
-        if self.stick_touch is not None and not any(t[0] == self.stick_touch and t[3] for t in touches):
+        if self.stick_touch is not None and self.stick_touch not in down:
             self.stick_touch, self.stick_vec = None, (0.0, 0.0)
-        for tid, x, y, dn in touches:
-            if not dn: continue
-            if self.stick_touch is None and _dist(x, y, *self.st_c) <= self.r_out:
+        sx, sy = self.st_c
+        for tid, (x, y) in down.items():
+            dx, dy = x - sx, y - sy
+            if self.stick_touch is None and dx * dx + dy * dy <= self.r_out_sq:
                 self.stick_touch = tid
             if tid == self.stick_touch:
-                dx, dy = x - self.st_c[0], y - self.st_c[1]
                 mag = max(1e-6, math.hypot(dx, dy))
                 mag_n = min(1.0, mag / self.r_out)
                 self.stick_vec = (dx / mag * mag_n, dy / mag * mag_n)
                 self._events.append(("move", {"vec": self.stick_vec}))
 
         # --- Button logic ---
-        current_btns = set()
-        for tid, x, y, dn in touches:
-            if not dn: continue
-            for name, (kind, data) in self.btn_defs.items():
-                hit = False
-                if kind == "circle":
-                    cx, cy, r = data
-                    hit = _dist(x, y, cx, cy) <= r
+        current = {}  # tid: names under that touch this frame
+        for tid, (x, y) in down.items():
+            names = self.hit_buttons(x, y)
+            if not names: continue
+            current[tid] = names
+            held = self.btn_touches.setdefault(tid, {})
+            for name in names:
+                if name in held: continue
+                held[name] = now
+                self.btn_states[name] = True  # pressed
+                # Immediate tap event for most buttons except LT/RT
+                if name == "RT":
+                    v = self.stick_vec
+                    if abs(v[0]) + abs(v[1]) > 0.25:
+                        self._events.append(("dodge", {}))
+                    else:
+                        self._events.append(("rocket", {}))
+                elif name == "LT":
+                    # Wait for tap/hold on release
+                    pass
                 else:
-                    rx, ry, rw, rh = data
-                    hit = rx <= x <= rx + rw and ry <= y <= ry + rh
-                if hit:
-                    current_btns.add((tid, name))
-                    if (tid, name) not in self.btn_touches:
-                        self.btn_touches[(tid, name)] = now
-                        self.btn_states[name] = True  # pressed
-                        # Immediate tap event for most buttons except LT/RT
-                        spec = self.cfg["buttons"][name]
-                        if name == "RT":
-                            v = self.stick_vec
-                            if abs(v[0]) + abs(v[1]) > 0.25:
-                                self._events.append(("dodge", {}))
-                            else:
-                                self._events.append(("rocket", {}))
-                        elif name == "LT":
-                            # Wait for tap/hold on release
-                            pass
-                        else:
-                            act = spec.get("action")
-                            if act: self._events.append((act, {}))
-
-        # Tap/hold detection for triggers (LT)
-        for (tid, name), down_time in list(self.btn_touches.items()):
-            if (tid, name) not in current_btns:
-                spec = self.cfg["buttons"][name]
-                duration = now - down_time
+                    act = self.cfg["buttons"][name].get("action")
+                    if act: self._events.append((act, {}))
+
+        # Releases (touch lifted or slid off a button); tap/hold detection for LT
+        for tid in list(self.btn_touches):
+            held, names = self.btn_touches[tid], current.get(tid, ())
+            for name in [n for n in held if n not in names]:
                 if name == "LT":
-                    if duration > 0.32:
+                    if now - held[name] > 0.32:
                         self._events.append(("crouch_cover", {}))
                     else:
                         self._events.append(("parry", {}))
-                del self.btn_touches[(tid, name)]
+                del held[name]
                 self.btn_states[name] = False
+            if not held:
+                del self.btn_touches[tid]
 
     def get_events(self):
         out = self._events.copy()
@@ -113,38 +234,50 @@ class VirtualPad:
 
     def is_btn_down(self, name): return self.btn_states.get(name, False)
 
-    def draw(self, surf, is_active=False):
-        opacity = self.opacity_active if is_active else self.opacity_idle
-        # Draw stick
-        stick_outer = self.assets.get("stick_outer")
-        stick_inner = self.assets.get("stick_inner")
-        if stick_outer:
-            s = stick_outer.copy(); s.set_alpha(opacity)
-            rect = s.get_rect(center=self.st_c)
-            surf.blit(s, rect)
-        else:
-            pygame.draw.circle(surf, (80,120,180,opacity), self.st_c, int(self.r_out), 4)
-        if stick_inner:
-            s = stick_inner.copy(); s.set_alpha(opacity)
-            p = (int(self.st_c[0]+self.stick_vec[0]*self.r_out), int(self.st_c[1]+self.stick_vec[1]*self.r_out))
-            rect = s.get_rect(center=p)
-            surf.blit(s, rect)
-        else:
-            p = (int(self.st_c[0]+self.stick_vec[0]*self.r_out), int(self.st_c[1]+self.stick_vec[1]*self.r_out))
-            pygame.draw.circle(surf, (128,220,255,opacity), p, int(self.r_in))
-        # Draw buttons
-        for name, (kind, data) in self.btn_defs.items():
-            img = self.assets.get(f"btn_{name.lower()}")
-            if img:
-                s = img.copy(); s.set_alpha(opacity)
-                if kind == "circle":
-                    rect = s.get_rect(center=(data[0], data[1]))
-                else:
-                    rect = s.get_rect(center=(data[0] + data[2]/2, data[1] + data[3]/2))
-                surf.blit(s, rect)
-            else:
-                color = (190, 80, 80, opacity) if self.is_btn_down(name) else (80, 80, 190, opacity)
-                if kind == "circle":
-                    pygame.draw.circle(surf, color, (int(data[0]), int(data[1])), int(data[2]))
-                else:
-                    pygame.draw.rect(surf, color, pygame.Rect(*data), border_radius=10)
+    def draw(self, surf, is_active=False, background=None):
+        """
+        Blit the pre-baked controls. The blit list is only rebuilt when the opacity,
+        knob position or a button's pressed state changed.
+
+        Without background every control is blitted (for callers that repaint the whole
+        frame). With background (what surf shows under the pad, same size) surf is taken
+        to still hold the last frame: only controls whose image or position changed are
+        restored from background and redrawn, and an idle pad blits nothing.
+        Returns the rects drawn.
+        """
+        knob = (int(self.st_c[0]+self.stick_vec[0]*self.r_out), int(self.st_c[1]+self.stick_vec[1]*self.r_out))
+        key = (is_active, knob, tuple(self.btn_states.values()))
+        if key != self._blits_key:
+            self._blits_key = key
+            self.rebuilds += 1
+            outer, inner = self.stick_outer[is_active], self.stick_inner[is_active]
+            blits = [(outer, outer.get_rect(center=self.st_c)), (inner, inner.get_rect(center=knob))]
+            variant = "active" if is_active else "idle"
+            for name, rect in self.btn_rects.items():
+                blits.append((self.btn_imgs[name]["pressed" if self.btn_states[name] else variant], rect))
+            self._blits = blits
+        if background is None:
+            return surf.blits(self._blits)
+
+        shown, self._shown = self._shown, self._blits
+        if shown is None:
+            surf.blits([(background, r, r) for _, r in self._blits])
+            return surf.blits(self._blits)
+        if shown is self._blits:
+            return []
+        dirty = []
+        for (old_img, old_rect), (img, rect) in zip(shown, self._blits):
+            if old_img is not img or old_rect != rect:
+                dirty.append(old_rect)
+                if rect != old_rect:
+                    dirty.append(rect)
+        # One area at a time: restore it, then redraw (clipped) every control touching it
+        # in stacking order, so overlapping areas never get a control blended in twice
+        for r in dirty:
+            redraw = [(background, r, r)]
+            for img, rect in self._blits:
+                clip = rect.clip(r)
+                if clip:
+                    redraw.append((img, clip, clip.move(-rect.x, -rect.y)))
+            surf.blits(redraw, False)
+        return dirty
@@ -4,3 +4,5 @@ from .entity import Entity
 from .player import Player
 from .enemy import Enemy
 from .npc import NPC
+from .pool import PooledEntity, EntityPool, EntityHandle
+from .projectile import Bullet
@@ -3,6 +3,9 @@
 import pygame
 from .entity import Entity
 
+# Enemies carrying this tag get their velocity from a SteeringSystem instead of update()
+BATCH_STEERED = "batch_steered"
+
 class Enemy(Entity):
     def __init__(self, pos, image=None):
         super().__init__(pos, image, size=(32, 32))
@@ -13,10 +16,15 @@ class Enemy(Entity):
 
     def update(self, dt, game=None):
         # Example: simple AI to move toward player
-        if game and hasattr(game, "player"):
+        if game and hasattr(game, "player") and BATCH_STEERED not in self.tags:
             to_player = game.player.pos - self.pos
             dist = to_player.length()
-            if dist > 1:
+            # Follow the shared flow field when the level has one (O(1) lookup)
+            flow = getattr(game, "flow_field", None)
+            step = flow.sample(self.pos) if flow is not None else None
+            if step is not None:
+                self.vel = pygame.Vector2(step) * self.speed
+            elif dist > 1:
                 self.vel = to_player.normalize() * self.speed
             else:
                 self.vel = pygame.Vector2()
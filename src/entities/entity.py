@@ -1,21 +1,83 @@
 # src/entities/entity.py
 
 import pygame
+from .tag_index import TagSet
 
 class Entity:
+    # Slotted so pooled subclasses can stay dict-free; ordinary subclasses still get a __dict__
+    __slots__ = (
+        "_store", "_slot", "_pos", "_vel", "size", "image", "rect",
+        "alive", "_manager", "_tags", "_prev", "__weakref__",
+    )
+
     def __init__(self, pos, image=None, size=(32, 32)):
+        self._store = None  # EntityStore holding pos/vel when array-backed
+        self._slot = -1
         self.pos = pygame.Vector2(pos)
         self.vel = pygame.Vector2(0, 0)
+        self._prev = pygame.Vector2(self._pos)  # pos before the last EntityManager step
         self.size = size
         self.image = image  # pygame.Surface or None
         self.rect = pygame.Rect(self.pos.x, self.pos.y, *self.size)
         self.alive = True
+        self._manager = None  # set by EntityManager while the entity is in its world
         self.tags = set()
 
+    # pos/vel live in the entity's own Vector2s, or in an EntityStore row once attached.
+    # Store-backed reads return a copy: assign to pos/vel instead of mutating in place.
+    @property
+    def pos(self):
+        if self._store is not None:
+            return self._store.get_pos(self._slot)
+        return self._pos
+
+    @pos.setter
+    def pos(self, value):
+        if self._store is not None:
+            self._store.set_pos(self._slot, value)
+        else:
+            self._pos = value if isinstance(value, pygame.Vector2) else pygame.Vector2(value)
+
+    @property
+    def vel(self):
+        if self._store is not None:
+            return self._store.get_vel(self._slot)
+        return self._vel
+
+    @vel.setter
+    def vel(self, value):
+        if self._store is not None:
+            self._store.set_vel(self._slot, value)
+        else:
+            self._vel = value if isinstance(value, pygame.Vector2) else pygame.Vector2(value)
+
+    @property
+    def prev_pos(self):
+        """Position before the last simulation step, for render interpolation."""
+        if self._store is not None:
+            return self._store.get_prev(self._slot)
+        return self._prev
+
+    @property
+    def tags(self):
+        return self._tags
+
+    @tags.setter
+    def tags(self, value):
+        # Wrap in a TagSet so the manager's tag index follows later add/discard calls
+        manager = self._manager
+        if manager is not None:
+            manager.tag_index.remove(self)
+        self._tags = TagSet(self, value)
+        if manager is not None:
+            manager.tag_index.add(self)
+
     def update(self, dt, game=None):
-        """Update entity logic. dt = delta time, game = game state/context."""
-        self.pos += self.vel * dt
-        self.rect.topleft = (int(self.pos.x), int(self.pos.y))
+        """Update entity logic. dt = delta time, game = game state/context.
+        Array-backed entities are integrated in bulk by EntityManager after all updates run."""
+        if self._store is None:
+            self._pos += self._vel * dt
+            self.rect.topleft = (int(self._pos.x), int(self._pos.y))
 
     def draw(self, surf, camera=(0,0)):
         """Draw the entity. camera = (x, y) offset for scrolling."""
@@ -33,3 +95,5 @@ class Entity:
 
     def kill(self):
         self.alive = False
+        if self._manager is not None:
+            self._manager._on_kill(self)
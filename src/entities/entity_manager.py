@@ -1,60 +1,262 @@
 # src/entities/entity_manager.py
 
+import pygame
+from .spatial_hash import SpatialHash
+from .tag_index import TagIndex
+
 class EntityManager:
-    def __init__(self):
+    def __init__(self, cell_size=64, use_store=False, store_capacity=256, cull_margin=32):
         self.entities = []
         self.to_add = []
         self.to_remove = set()
+        # Broad phase for collisions; cell_size=None keeps the old all-pairs path.
+        self.grid = SpatialHash(cell_size) if cell_size else None
+        # tag -> live entities, kept current by add/remove/kill and Entity.tags edits
+        self.tag_index = TagIndex()
+        self._order = {}  # entity: index in self.entities (keeps results in list order)
+        # draw() culls to the camera view; margin catches images larger than their rect
+        self.cull_margin = cull_margin
+        self.draw_stats = {"drawn": 0, "culled": 0}
+        self._drawn_rects = []  # screen rects from the last dirty draw, to present what moved away
+        # Optional struct-of-arrays movement (needs numpy): entity updates only steer,
+        # then every attached entity is integrated in one vectorized step.
+        self.store = None
+        if use_store:
+            from .entity_store import EntityStore
+            self.store = EntityStore(store_capacity)
 
     def add(self, entity):
         """Queue an entity to be added on the next update (avoids modifying list during iteration)."""
         self.to_add.append(entity)
 
     def remove(self, entity):
-        """Queue an entity for removal."""
+        """Queue an entity for removal. It stops showing up in tag queries right away."""
+        self.to_remove.add(entity)
+        if getattr(entity, "_manager", None) is self:
+            self.tag_index.remove(entity)
+            entity._manager = None
+
+    def _on_kill(self, entity):
+        # Called by Entity.kill(): queue it so update() drops it without scanning the world
+        self.tag_index.remove(entity)
         self.to_remove.add(entity)
 
     def update(self, dt, game=None):
-        # Add and remove entities safely
+        # Drop removed/killed entities first (O(1) swap-remove each), then add new ones
+        removed, self.to_remove = self.to_remove, set()
+        for e in removed:
+            if e in self._order:
+                self._swap_remove(e)
         for entity in self.to_add:
-            self.entities.append(entity)
+            if entity.alive and entity not in removed:
+                self._join(entity)
+            else:
+                self._release(entity)
         self.to_add.clear()
 
-        self.entities = [e for e in self.entities if e not in self.to_remove and e.alive]
-        self.to_remove.clear()
-
-        # Update all entities
+        # Update all entities, re-bucketing them as their rects move
+        grid, store = self.grid, self.store
+        if store is not None and store.count:
+            store.snapshot()
+        dead = []
         for entity in self.entities:
+            if not entity.alive:  # alive cleared without kill()
+                dead.append(entity)
+                continue
+            own = getattr(entity, "_store", None) is None
+            if own:
+                prev = getattr(entity, "_prev", None)
+                if prev is not None:
+                    prev.update(entity._pos)  # pre-step position for draw(alpha=...)
             entity.update(dt, game)
+            if grid is not None and own:
+                grid.move(entity)
+        for entity in dead:
+            self._swap_remove(entity)
 
-    def draw(self, surf, camera=(0,0)):
-        for entity in self.entities:
-            entity.draw(surf, camera)
+        if store is not None and store.count:
+            store.integrate(dt)
+            moved = store.sync_rects(grid.cell_size if grid is not None else None)
+            if grid is not None:
+                for entity in moved:
+                    grid.move(entity)
+
+    def _join(self, entity):
+        self._order[entity] = len(self.entities)
+        self.entities.append(entity)
+        entity._manager = self
+        self.tag_index.add(entity)
+        if self.grid is not None:
+            self.grid.move(entity)
+        if self.store is not None and hasattr(entity, "_store"):
+            self.store.attach(entity)
+
+    def _swap_remove(self, entity):
+        # Move the last entity into the freed slot; list order is not preserved
+        i = self._order.pop(entity)
+        last = self.entities.pop()
+        if last is not entity:
+            self.entities[i] = last
+            self._order[last] = i
+        self._drop(entity)
+
+    def _drop(self, entity):
+        if self.grid is not None:
+            self.grid.remove(entity)
+        if self.store is not None and getattr(entity, "_store", None) is self.store:
+            self.store.detach(entity)
+        self.tag_index.remove(entity)
+        if getattr(entity, "_manager", None) is self:
+            entity._manager = None
+        self._release(entity)
+
+    def _release(self, entity):
+        # A pooled entity can be handed out again straight away; a stale removal
+        # request must not drop its next life.
+        self.to_remove.discard(entity)
+        pool = getattr(entity, "pool", None)
+        if pool is not None:
+            pool.release(entity)
+
+    def draw(self, surf, camera=(0,0), dirty=False, alpha=1.0):
+        """
+        Draw entities overlapping the camera view (surf-sized, at camera), in list order.
+        Counts land in draw_stats.
+        alpha < 1 (fixed-step interpolation factor) draws each entity between its
+        position before the last update() and its current one; draw() implementations
+        see it as a shifted camera.
+        dirty=True returns the screen rects that changed: everything drawn this frame plus
+        what was drawn last frame (the spots entities moved away from).
+        """
+        visible = self.visible(pygame.Rect(camera, surf.get_size()))
+        self.draw_stats["drawn"] = len(visible)
+        self.draw_stats["culled"] = len(self.entities) - len(visible)
+        if alpha >= 1.0:
+            cameras = [camera] * len(visible)
+        else:
+            cameras = [self._lerp_camera(e, camera, alpha) for e in visible]
+        for entity, cam in zip(visible, cameras):
+            entity.draw(surf, cam)
+        if not dirty:
+            return None
+        rects = []
+        for e, (cx, cy) in zip(visible, cameras):
+            r = e.rect.move(-int(cx), -int(cy))
+            image = getattr(e, "image", None)
+            if image:
+                # draw() blits the image at pos, and it can be larger than the rect
+                pos = e.pos
+                r.union_ip(image.get_rect(topleft=(int(pos.x - cx), int(pos.y - cy))))
+            rects.append(r)
+        return self._dirty_rects(rects)
+
+    @staticmethod
+    def _lerp_camera(entity, camera, alpha):
+        # Drawing at prev + (pos - prev) * alpha is drawing at pos with the camera
+        # moved by (pos - prev) * (1 - alpha)
+        prev = getattr(entity, "prev_pos", None)
+        if prev is None:
+            return camera
+        pos = entity.pos
+        t = 1.0 - alpha
+        return (camera[0] + (pos.x - prev.x) * t, camera[1] + (pos.y - prev.y) * t)
+
+    def _dirty_rects(self, rects):
+        prev, self._drawn_rects = self._drawn_rects, rects
+        return rects + prev
+
+    def visible(self, view):
+        """Entities whose rect or image overlaps view, in list (draw) order."""
+        m = self.cull_margin
+        if self.grid is not None:
+            order = self._order
+            candidates = sorted(self.grid.query(view.inflate(2 * m, 2 * m)), key=order.__getitem__)
+        else:
+            candidates = self.entities
+        out = []
+        for e in candidates:
+            r = e.rect
+            if r.colliderect(view):
+                out.append(e)
+                continue
+            image = getattr(e, "image", None)
+            if image is not None and view.colliderect(r.topleft, image.get_size()):
+                out.append(e)
+        return out
 
     def get_by_tag(self, tag):
-        """Yield all entities with a given tag."""
-        return (e for e in self.entities if tag in getattr(e, "tags", set()))
+        """Return the live entities with a given tag (O(matches), from the tag index)."""
+        return self.tag_index.get(tag)
+
+    def get_all_tags(self, *tags):
+        """Live entities carrying every one of tags."""
+        return self.tag_index.all_of(*tags)
+
+    def get_any_tag(self, *tags):
+        """Live entities carrying at least one of tags."""
+        return self.tag_index.any_of(*tags)
 
     def clear(self):
+        if self.store is not None:
+            self.store.clear()
+        for e in self.entities:
+            if getattr(e, "_manager", None) is self:
+                e._manager = None
+            self._release(e)
+        for e in self.to_add:
+            self._release(e)
         self.entities.clear()
         self.to_add.clear()
         self.to_remove.clear()
+        self._order.clear()
+        self.tag_index.clear()
+        if self.grid is not None:
+            self.grid.clear()
+
+    def _tagged(self, tag):
+        # Tag members in list order, so collision results don't depend on tagging order
+        order = self._order
+        return sorted(self.tag_index.get(tag), key=lambda e: order.get(e, len(order)))
 
     def handle_collisions(self, group1=None, group2=None):
         """
         Check collisions between two groups (by tag).
         If group2 is None, check all-vs-all (not recommended for lots of entities).
         Calls on_collide(other, game) for each collision.
+        With a grid, each entity of group1 is only tested against group2 entities in
+        nearby cells; pairs are still visited in list order, so the calls match the
+        all-pairs path exactly.
         """
         if group1 is None:
             group1 = self.entities
         else:
-            group1 = list(self.get_by_tag(group1))
+            group1 = self._tagged(group1)
+
+        if self.grid is None:
+            self._collide_all_pairs(group1, group2)
+            return
+
+        # Snapshot group2 so kills inside on_collide don't change who gets tested
+        in_group2 = None if group2 is None else set(self.tag_index.buckets.get(group2, ()))
+        order = self._order
+        query = self.grid.query
+        for a in group1:
+            if not hasattr(a, "rect"):
+                continue
+            near = query(a.rect)
+            if in_group2 is not None:
+                near &= in_group2
+            near.discard(a)
+            for b in sorted(near, key=order.__getitem__):
+                if a.rect.colliderect(b.rect):
+                    a.on_collide(b)
+                    b.on_collide(a)
 
+    def _collide_all_pairs(self, group1, group2):
         if group2 is None:
             group2 = self.entities
         else:
-            group2 = list(self.get_by_tag(group2))
+            group2 = self._tagged(group2)
 
         for a in group1:
             for b in group2:
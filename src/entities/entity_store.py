@@ -0,0 +1,136 @@
+# src/entities/entity_store.py
+
+import numpy as np
+import pygame
+
+_UNSET_SPAN = (-1 << 40,) * 4
+
+class EntityStore:
+    """
+    Struct-of-arrays storage for entity movement. Positions, velocities and sizes live
+    in contiguous float arrays; slots [0:count) are packed (swap-remove on detach), so
+    integrate() is one vectorized step for every attached entity.
+
+    Attached entities read pos/vel through Entity properties, which hand back Vector2
+    copies of their row. Assign (e.pos = ..., e.vel = ...) rather than mutating the
+    returned vector in place.
+    """
+    def __init__(self, capacity=256):
+        capacity = max(1, int(capacity))
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.prev = np.zeros((capacity, 2), dtype=np.float64)  # pos before the last step
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.size = np.zeros((capacity, 2), dtype=np.float64)
+        # Last rect position written and grid cell span (x0, y0, x1, y1) per slot,
+        # so sync_rects only touches entities that actually changed
+        self.ipos = np.zeros((capacity, 2), dtype=np.int64)
+        self.span = np.zeros((capacity, 4), dtype=np.int64)
+        self.entities = []  # slot -> entity
+        self.count = 0
+
+    @property
+    def capacity(self):
+        return len(self.pos)
+
+    def _grow(self):
+        cap = self.capacity * 2
+        for name in ("pos", "prev", "vel", "size", "ipos", "span"):
+            old = getattr(self, name)
+            new = np.zeros((cap, old.shape[1]), dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def attach(self, entity):
+        """Move an entity's pos/vel/size into the arrays."""
+        if entity._store is not None:
+            return
+        if self.count == self.capacity:
+            self._grow()
+        slot = self.count
+        self.pos[slot] = (entity._pos.x, entity._pos.y)
+        self.prev[slot] = (entity._prev.x, entity._prev.y)
+        self.vel[slot] = (entity._vel.x, entity._vel.y)
+        self.size[slot] = entity.size
+        self.ipos[slot] = entity.rect.topleft
+        self.span[slot] = _UNSET_SPAN
+        self.entities.append(entity)
+        self.count += 1
+        entity._store, entity._slot = self, slot
+
+    def detach(self, entity):
+        """Copy the entity's row back into its own vectors and free the slot (swap-remove)."""
+        if entity._store is not self:
+            return
+        slot = entity._slot
+        entity._pos = pygame.Vector2(*self.pos[slot].tolist())
+        entity._prev = pygame.Vector2(*self.prev[slot].tolist())
+        entity._vel = pygame.Vector2(*self.vel[slot].tolist())
+        entity._store, entity._slot = None, -1
+
+        last = self.count - 1
+        if slot != last:
+            self.pos[slot] = self.pos[last]
+            self.prev[slot] = self.prev[last]
+            self.vel[slot] = self.vel[last]
+            self.size[slot] = self.size[last]
+            self.ipos[slot] = self.ipos[last]
+            self.span[slot] = self.span[last]
+            moved = self.entities[last]
+            self.entities[slot] = moved
+            moved._slot = slot
+        self.entities.pop()
+        self.count = last
+
+    def get_pos(self, slot):
+        return pygame.Vector2(*self.pos[slot].tolist())
+
+    def set_pos(self, slot, value):
+        self.pos[slot] = (value[0], value[1])
+
+    def get_prev(self, slot):
+        return pygame.Vector2(*self.prev[slot].tolist())
+
+    def snapshot(self):
+        """Remember every position before a step, for render interpolation."""
+        n = self.count
+        self.prev[:n] = self.pos[:n]
+
+    def get_vel(self, slot):
+        return pygame.Vector2(*self.vel[slot].tolist())
+
+    def set_vel(self, slot, value):
+        self.vel[slot] = (value[0], value[1])
+
+    def integrate(self, dt):
+        n = self.count
+        self.pos[:n] += self.vel[:n] * dt
+
+    def sync_rects(self, cell_size=None):
+        """
+        Write integer positions into the rects that moved. Returns the moved entities,
+        or with cell_size, only those whose grid cell span changed (the ones a
+        SpatialHash of that cell size needs to re-bucket).
+        """
+        n = self.count
+        # astype truncates toward zero, same as int() in Entity.update
+        xy = self.pos[:n].astype(np.int64)
+        changed = np.flatnonzero((xy != self.ipos[:n]).any(axis=1))
+        self.ipos[:n] = xy
+        ents = self.entities
+        for i, x, y in zip(changed.tolist(), xy[changed, 0].tolist(), xy[changed, 1].tolist()):
+            ents[i].rect.topleft = (x, y)
+
+        if cell_size is None:
+            return [ents[i] for i in changed.tolist()]
+        # Same span maths as SpatialHash._span, for every slot at once
+        wh = np.maximum(self.size[:n].astype(np.int64), 1)
+        span = np.empty((n, 4), dtype=np.int64)
+        span[:, :2] = xy // cell_size
+        span[:, 2:] = (xy + wh - 1) // cell_size
+        rebucket = np.flatnonzero((span != self.span[:n]).any(axis=1))
+        self.span[:n] = span
+        return [ents[i] for i in rebucket.tolist()]
+
+    def clear(self):
+        for e in list(self.entities):
+            self.detach(e)
@@ -0,0 +1,114 @@
+# src/entities/pool.py
+
+from collections import namedtuple
+from .entity import Entity
+
+# Stable reference to a pooled entity: resolves to None once that instance is recycled.
+EntityHandle = namedtuple("EntityHandle", "index generation")
+
+class PooledEntity(Entity):
+    """
+    Entity that is recycled through an EntityPool instead of reallocated.
+    Subclasses should declare __slots__ too and override reset() to reinitialise
+    their own fields; the Vector2s, Rect and TagSet are reused as-is.
+    """
+    __slots__ = ("pool", "pool_index", "generation", "in_pool")
+
+    def __init__(self, pos=(0, 0), image=None, size=(8, 8)):
+        super().__init__(pos, image, size=size)
+        self.pool = None
+        self.pool_index = -1
+        self.generation = 0
+        self.in_pool = False
+
+    def reset(self, pos, vel=(0, 0)):
+        """Reinitialise a recycled entity in place."""
+        self._pos.update(pos)
+        self._prev.update(pos)  # no interpolation streak from the previous life
+        self._vel.update(vel)
+        self.rect.topleft = (int(self._pos.x), int(self._pos.y))
+        self.alive = True
+
+
+class EntityPool:
+    """
+    Free-list pool of PooledEntity instances. acquire() reuses a released instance
+    when one is free (hit) and only constructs on a miss. EntityManager releases pooled
+    entities back automatically when it drops them, bumping their generation so old
+    handles stop resolving.
+    """
+    def __init__(self, factory, prewarm=0):
+        self.factory = factory  # zero-arg callable, usually the PooledEntity subclass
+        self.slots = []         # pool_index -> entity, for handle lookup
+        self.free = []
+        self.hits = 0
+        self.misses = 0
+        self.releases = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.prewarm(prewarm)
+
+    def _create(self):
+        e = self.factory()
+        e.pool = self
+        e.pool_index = len(self.slots)
+        self.slots.append(e)
+        return e
+
+    def prewarm(self, n):
+        """Construct n spare instances up front (not counted as misses)."""
+        for _ in range(n):
+            e = self._create()
+            e.alive = False
+            e.in_pool = True
+            self.free.append(e)
+
+    def acquire(self, *args, **kwargs):
+        """Get an entity, reset with args. Add it to an EntityManager as usual."""
+        if self.free:
+            e = self.free.pop()
+            self.hits += 1
+        else:
+            e = self._create()
+            self.misses += 1
+        e.in_pool = False
+        e.reset(*args, **kwargs)
+        self.in_use += 1
+        if self.in_use > self.peak_in_use:
+            self.peak_in_use = self.in_use
+        return e
+
+    def release(self, e):
+        if e.pool is not self or e.in_pool:
+            return
+        e.alive = False
+        e.in_pool = True
+        e.generation += 1
+        self.free.append(e)
+        self.in_use -= 1
+        self.releases += 1
+
+    def handle(self, e):
+        return EntityHandle(e.pool_index, e.generation)
+
+    def resolve(self, handle):
+        """The entity a handle refers to, or None if it has since been killed or recycled."""
+        if not 0 <= handle.index < len(self.slots):
+            return None
+        e = self.slots[handle.index]
+        if e.generation != handle.generation or e.in_pool or not e.alive:
+            return None
+        return e
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "releases": self.releases,
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+            "free": len(self.free),
+            "allocated": len(self.slots),
+        }
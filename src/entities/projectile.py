@@ -0,0 +1,29 @@
+# src/entities/projectile.py
+
+from .pool import PooledEntity
+
+class Bullet(PooledEntity):
+    """Pooled projectile. Acquire from an EntityPool(Bullet) rather than constructing per shot."""
+    __slots__ = ("damage", "lifetime")
+
+    def __init__(self, pos=(0, 0), image=None):
+        super().__init__(pos, image, size=(6, 6))
+        self.tags.add("bullet")
+        self.damage = 10
+        self.lifetime = 2.0
+
+    def reset(self, pos, vel=(0, 0), damage=10, lifetime=2.0):
+        super().reset(pos, vel)
+        self.damage = damage
+        self.lifetime = lifetime
+
+    def update(self, dt, game=None):
+        self.lifetime -= dt
+        if self.lifetime <= 0:
+            self.kill()
+            return
+        super().update(dt, game)
+
+    def on_collide(self, other, game=None):
+        if getattr(other, "tags", None) and "enemy" in other.tags:
+            self.kill()
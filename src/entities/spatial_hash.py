@@ -0,0 +1,80 @@
+# src/entities/spatial_hash.py
+
+class SpatialHash:
+    """
+    Uniform-grid broad phase. Entities are bucketed by the cells their rect covers,
+    so a rect query only touches nearby entities instead of the whole world.
+    Call move() after an entity's rect changes; it only re-buckets when the covered
+    cell range actually changed.
+    """
+    def __init__(self, cell_size=64):
+        self.cell_size = int(cell_size)
+        self.cells = {}    # (cx, cy): set of entities
+        self._spans = {}   # entity: (x0, y0, x1, y1) cell range it is bucketed in
+
+    def _span(self, rect):
+        cs = self.cell_size
+        # right/bottom are exclusive, so a 32px rect at x=0 stays in one 32px cell
+        return (
+            rect.left // cs,
+            rect.top // cs,
+            (rect.right - 1) // cs if rect.width > 0 else rect.left // cs,
+            (rect.bottom - 1) // cs if rect.height > 0 else rect.top // cs,
+        )
+
+    def insert(self, entity):
+        span = self._span(entity.rect)
+        self._spans[entity] = span
+        x0, y0, x1, y1 = span
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = bucket = set()
+                bucket.add(entity)
+
+    def remove(self, entity):
+        span = self._spans.pop(entity, None)
+        if span is None:
+            return
+        x0, y0, x1, y1 = span
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.discard(entity)
+                    if not bucket:
+                        del cells[(cx, cy)]
+
+    def move(self, entity):
+        """Re-bucket an entity whose rect may have changed. Cheap when it stayed in its cells."""
+        old = self._spans.get(entity)
+        if old is None:
+            self.insert(entity)
+        elif old != self._span(entity.rect):
+            self.remove(entity)
+            self.insert(entity)
+
+    def __contains__(self, entity):
+        return entity in self._spans
+
+    def __len__(self):
+        return len(self._spans)
+
+    def query(self, rect):
+        """Return the set of entities bucketed in any cell overlapping rect (candidates only)."""
+        x0, y0, x1, y1 = self._span(rect)
+        cells = self.cells
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found |= bucket
+        return found
+
+    def clear(self):
+        self.cells.clear()
+        self._spans.clear()
@@ -0,0 +1,131 @@
+# src/entities/steering.py
+
+import numpy as np
+import pygame
+from .enemy import BATCH_STEERED
+
+_KEY_STRIDE = 1 << 21  # packs (cx, cy) cell coords into one int64 key
+
+def _cell_counts(uniq, counts, query):
+    """How many entities sit in each query cell key (0 where the cell is empty)."""
+    idx = np.searchsorted(uniq, query)
+    idx = np.minimum(idx, len(uniq) - 1)
+    return np.where(uniq[idx] == query, counts[idx], 0)
+
+def steer(pos, speed, target, arrive_radius=0.0, stop_radius=1.0,
+          separation_radius=32.0, separation_weight=1.0, directions=None):
+    """
+    Seek/arrive/separate velocities for every row of pos (N x 2) in one pass.
+    speed is a scalar or an N array. directions (N x 2 unit vectors, e.g. from a flow
+    field) replaces the straight-line seek heading wherever a row is non-zero.
+    Separation is grid based: entities spread out from the centroid of their own cell
+    and away from the denser neighbouring cells, which keeps the whole step
+    O(N log N) instead of all-pairs.
+    """
+    pos = np.asarray(pos, dtype=np.float64)
+    n = len(pos)
+    speed = np.broadcast_to(np.asarray(speed, dtype=np.float64), (n,))
+    if n == 0:
+        return np.zeros((0, 2))
+
+    # Seek, slowing down inside arrive_radius; stop like Enemy.update does within stop_radius
+    d = np.asarray(target, dtype=np.float64) - pos
+    dist = np.hypot(d[:, 0], d[:, 1])
+    scale = speed / np.maximum(dist, 1e-9)
+    if arrive_radius > 0:
+        scale *= np.minimum(1.0, dist / arrive_radius)
+    vel = d * scale[:, None]
+    if directions is not None:
+        directions = np.asarray(directions, dtype=np.float64)
+        routed = directions.any(axis=1)
+        vel[routed] = directions[routed] * (scale * dist)[routed, None]
+    vel[dist <= stop_radius] = 0.0
+
+    if separation_weight > 0 and n > 1:
+        cs = float(separation_radius)
+        cell = np.floor(pos / cs).astype(np.int64)
+        cell -= cell.min(axis=0) - 1
+        cx, cy = cell[:, 0], cell[:, 1]
+        keys = cx * _KEY_STRIDE + cy
+        uniq, inv, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        inv = inv.reshape(-1)
+        own = counts[inv].astype(np.float64)
+
+        # Push away from the centroid of everyone sharing this cell...
+        cent_x = np.bincount(inv, weights=pos[:, 0]) / counts
+        cent_y = np.bincount(inv, weights=pos[:, 1]) / counts
+        push = np.empty_like(pos)
+        push[:, 0] = (pos[:, 0] - cent_x[inv]) / cs * (own - 1)
+        push[:, 1] = (pos[:, 1] - cent_y[inv]) / cs * (own - 1)
+        # ...and down the density gradient between neighbouring cells
+        push[:, 0] += (_cell_counts(uniq, counts, keys - _KEY_STRIDE)
+                       - _cell_counts(uniq, counts, keys + _KEY_STRIDE))
+        push[:, 1] += (_cell_counts(uniq, counts, keys - 1)
+                       - _cell_counts(uniq, counts, keys + 1))
+
+        mag = np.hypot(push[:, 0], push[:, 1])
+        moving = mag > 0
+        push[moving] /= mag[moving, None]
+        vel += push * (speed * separation_weight)[:, None]
+
+        # Never exceed the entity's own speed
+        vmag = np.hypot(vel[:, 0], vel[:, 1])
+        over = vmag > speed
+        vel[over] *= (speed[over] / vmag[over])[:, None]
+    return vel
+
+
+class SteeringSystem:
+    """
+    Batched seek/arrive/separation for every entity tagged with `tag` that has been
+    attach()ed. Call update(manager, target_pos) once per frame before manager.update();
+    it writes velocities straight into the EntityStore rows when the manager has one.
+    With a flow_field (navigation.FlowFieldNavigator) headings follow the level's
+    routes instead of a straight line.
+    """
+    def __init__(self, tag="enemy", arrive_radius=0.0, stop_radius=1.0,
+                 separation_radius=32.0, separation_weight=1.0, flow_field=None):
+        self.tag = tag
+        self.flow_field = flow_field
+        self.arrive_radius = arrive_radius
+        self.stop_radius = stop_radius
+        self.separation_radius = separation_radius
+        self.separation_weight = separation_weight
+
+    def attach(self, entity):
+        entity.tags.add(self.tag)
+        entity.tags.add(BATCH_STEERED)
+
+    def detach(self, entity):
+        entity.tags.discard(BATCH_STEERED)
+
+    def update(self, manager, target):
+        group = manager.get_all_tags(self.tag, BATCH_STEERED)
+        n = len(group)
+        if not n:
+            return 0
+
+        store = manager.store
+        slots = np.fromiter((getattr(e, "_slot", -1) for e in group), dtype=np.intp, count=n)
+        stored = slots >= 0
+        pos = np.empty((n, 2))
+        if store is not None:
+            pos[stored] = store.pos[slots[stored]]
+        loose = np.flatnonzero(~stored).tolist()
+        for i in loose:
+            p = group[i].pos
+            pos[i] = (p.x, p.y)
+
+        speed = np.fromiter((e.speed for e in group), dtype=np.float64, count=n)
+        directions = self.flow_field.sample_many(pos) if self.flow_field is not None else None
+        vel = steer(
+            pos, speed, (target[0], target[1]),
+            self.arrive_radius, self.stop_radius,
+            self.separation_radius, self.separation_weight, directions,
+        )
+
+        if store is not None:
+            store.vel[slots[stored]] = vel[stored]
+        for i in loose:
+            group[i].vel = pygame.Vector2(*vel[i].tolist())
+        return n
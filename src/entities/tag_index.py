@@ -0,0 +1,156 @@
+# src/entities/tag_index.py
+
+class TagSet(set):
+    """
+    A set of tags that tells its entity's manager when it changes, so the manager's
+    TagIndex stays current without rescanning. Behaves like a normal set otherwise.
+    """
+    def __init__(self, owner, tags=()):
+        super().__init__(tags)
+        self._owner = owner
+
+    def __reduce__(self):
+        # set's default rebuilds as TagSet(tags), which would pass the tags as owner.
+        # Keep the owner so deepcopy/pickle of an entity rebind its copy's tags to it.
+        return (self.__class__, (self._owner, list(self)))
+
+    def __copy__(self):
+        # A shallow copy is a detached snapshot; editing it must not touch the index
+        return set(self)
+
+    def _index(self):
+        owner = self._owner
+        manager = getattr(owner, "_manager", None)
+        if manager is None or not getattr(owner, "alive", True):
+            return None
+        return manager.tag_index
+
+    def add(self, tag):
+        if tag not in self:
+            super().add(tag)
+            index = self._index()
+            if index is not None:
+                index.add_tag(self._owner, tag)
+
+    def discard(self, tag):
+        if tag in self:
+            super().discard(tag)
+            index = self._index()
+            if index is not None:
+                index.remove_tag(self._owner, tag)
+
+    def remove(self, tag):
+        if tag not in self:
+            raise KeyError(tag)
+        self.discard(tag)
+
+    def pop(self):
+        if not self:
+            raise KeyError("pop from an empty set")
+        tag = next(iter(self))
+        self.discard(tag)
+        return tag
+
+    def clear(self):
+        for tag in list(self):
+            self.discard(tag)
+
+    def update(self, *others):
+        for other in others:
+            for tag in other:
+                self.add(tag)
+
+    def difference_update(self, *others):
+        for other in others:
+            for tag in list(other):
+                self.discard(tag)
+
+    def intersection_update(self, *others):
+        keep = set(self).intersection(*others)
+        for tag in list(self):
+            if tag not in keep:
+                self.discard(tag)
+
+    def symmetric_difference_update(self, other):
+        for tag in set(other):
+            if tag in self:
+                self.discard(tag)
+            else:
+                self.add(tag)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+    def __iand__(self, other):
+        self.intersection_update(other)
+        return self
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self
+
+
+class TagIndex:
+    """
+    tag -> live entities carrying it. Buckets are dicts used as ordered sets, so
+    lookups cost O(matches) and iterate in the order entities joined the tag.
+    """
+    def __init__(self):
+        self.buckets = {}
+
+    def add(self, entity):
+        for tag in getattr(entity, "tags", ()):
+            self.add_tag(entity, tag)
+
+    def remove(self, entity):
+        for tag in getattr(entity, "tags", ()):
+            self.remove_tag(entity, tag)
+
+    def add_tag(self, entity, tag):
+        bucket = self.buckets.get(tag)
+        if bucket is None:
+            self.buckets[tag] = bucket = {}
+        bucket[entity] = None
+
+    def remove_tag(self, entity, tag):
+        bucket = self.buckets.get(tag)
+        if bucket is not None:
+            bucket.pop(entity, None)
+            if not bucket:
+                del self.buckets[tag]
+
+    def get(self, tag):
+        """Live entities with tag (a snapshot list, safe to iterate while killing)."""
+        return list(self.buckets.get(tag, ()))
+
+    def count(self, tag):
+        return len(self.buckets.get(tag, ()))
+
+    def all_of(self, *tags):
+        """Entities carrying every tag. Scans only the smallest bucket."""
+        if not tags:
+            return []
+        buckets = [self.buckets.get(t) for t in tags]
+        if not all(buckets):
+            return []
+        buckets.sort(key=len)
+        first, rest = buckets[0], buckets[1:]
+        if len(rest) == 1:
+            other = rest[0]
+            return [e for e in first if e in other]
+        return [e for e in first if all(e in b for b in rest)]
+
+    def any_of(self, *tags):
+        """Entities carrying at least one tag, each listed once."""
+        out = {}
+        for t in tags:
+            out.update(self.buckets.get(t, {}))
+        return list(out)
+
+    def clear(self):
+        self.buckets.clear()
@@ -0,0 +1,185 @@
+# src/headless.py
+"""
+SotoWorks Python Console ALPHA 1 Engine — headless simulation runner.
+
+Runs a scene with SDL's dummy video/audio drivers, no drawing and no clock.tick
+cap, so balance and regression sims (ISO Strike seeds, drone waves) go as fast as
+the CPU allows. Reports simulated ticks per second, and can fan out N independent
+game instances across a process pool.
+
+    python src/headless.py --scene scene_basic:BasicScene --ticks 36000
+    python src/headless.py --scene scene_basic:BasicScene --instances 8 --processes 4
+
+With --replay, the scene is driven by a recorded input log (engine/input_replay.py)
+under the log's fixed dt and seed, and per-frame times are reported as percentiles,
+so runs on different builds do identical work:
+
+    python src/headless.py --scene scene_basic:BasicScene --replay runs/level1.swir --draw
+"""
+
+import os
+
+# Must be set before pygame initialises SDL
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# SDL turns SIGTERM into a quit event, which would keep pool workers from shutting down
+os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import importlib
+import inspect
+import pathlib
+import random
+import sys
+import time
+import multiprocessing
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+for p in (str(ROOT), str(ROOT / "src")):
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+import pygame as pg
+from engine.boot.config import load_config
+from engine.scene.manager import SceneManager
+
+LOGICAL_SIZE = (480, 320)
+
+def init_headless():
+    """Start pygame on the dummy drivers with a tiny window, so code that asks for the
+    display surface (input_manager, convert()) still works."""
+    pg.init()
+    if pg.display.get_surface() is None:
+        pg.display.set_mode((1, 1))
+
+def load_scene_factory(spec):
+    """'module:callable' -> callable, e.g. 'scene_basic:BasicScene'."""
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"scene spec must look like module:callable, got {spec!r}")
+    return getattr(importlib.import_module(module_name), attr)
+
+def make_scene(factory, surface):
+    # Scenes take either nothing (BasicScene) or the surface they draw to (MenuScene)
+    required = [
+        p for p in inspect.signature(factory).parameters.values()
+        if p.default is p.empty and p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+    ]
+    return factory(surface) if required else factory()
+
+def seed_everything(seed):
+    random.seed(seed)
+    try:
+        import numpy as np
+        np.random.seed(seed)
+    except ImportError:
+        pass
+
+def percentiles(samples, points=(50, 95, 99)):
+    """Nearest-rank percentiles of samples, plus max, as {"p50": ..., "max": ...}."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    out = {f"p{p}": ordered[min(len(ordered) - 1, max(0, -(-p * len(ordered) // 100) - 1))] for p in points}
+    out["max"] = ordered[-1]
+    return out
+
+def run_headless(scene_spec, ticks, dt, seed=0, draw=False, replay=None):
+    """
+    Run one game instance for `ticks` fixed steps of dt. Returns a stats dict.
+    With replay (path to an input log), dt and seed come from the log, ticks defaults
+    to its length, and the stats gain "frame_ms" percentiles.
+    """
+    init_headless()
+    source = None
+    if replay is not None:
+        from engine.input_replay import ReplayInput
+        source = ReplayInput(replay)
+        dt, seed = source.log.dt, source.log.seed
+        if ticks is None:
+            ticks = source.log.frame_count
+    seed_everything(seed)
+    surface = pg.Surface(LOGICAL_SIZE)
+    sm = SceneManager()
+    scene = make_scene(load_scene_factory(scene_spec), surface)
+    sm.push(scene)
+
+    if source is None:
+        t0 = time.perf_counter()
+        for _ in range(ticks):
+            pg.event.pump()
+            sm.update(dt)
+            if draw:
+                sm.draw(surface)
+        wall = time.perf_counter() - t0
+    else:
+        source.attach(scene)
+        frame_ms = []
+        clock = time.perf_counter
+        t0 = clock()
+        for _ in range(ticks):
+            f0 = clock()
+            pg.event.pump()
+            source.advance()
+            sm.update(dt)
+            if draw:
+                sm.draw(surface)
+            frame_ms.append((clock() - f0) * 1000.0)
+        wall = clock() - t0
+    stats = {
+        "seed": seed,
+        "ticks": ticks,
+        "sim_seconds": ticks * dt,
+        "wall_seconds": wall,
+        "ticks_per_sec": ticks / wall if wall > 0 else float("inf"),
+        "realtime_factor": ticks * dt / wall if wall > 0 else float("inf"),
+    }
+    if source is not None:
+        stats["frame_ms"] = percentiles(frame_ms)
+    return stats
+
+def _worker(job):
+    return run_headless(*job)
+
+def run_many(scene_spec, instances, ticks, dt, processes=None, base_seed=0, draw=False, replay=None):
+    """
+    Run `instances` independent games (seeds base_seed..) across a process pool.
+    With replay every instance plays the same log, i.e. repeated benchmark runs.
+    """
+    jobs = [(scene_spec, ticks, dt, base_seed + i, draw, replay) for i in range(instances)]
+    if instances == 1 or processes == 1:
+        return [_worker(j) for j in jobs]
+    # spawn, not fork: each worker gets a fresh SDL instead of a copy of ours
+    with multiprocessing.get_context("spawn").Pool(processes) as pool:
+        return pool.map(_worker, jobs)
+
+def main(argv=None):
+    cfg = load_config(str(ROOT / "alpha_engine.toml"))
+    ap = argparse.ArgumentParser(description="Headless, faster-than-real-time simulation runner")
+    ap.add_argument("--scene", required=True, help="module:callable building the scene")
+    ap.add_argument("--ticks", type=int, default=None, help="default: 3600, or the replay's length")
+    ap.add_argument("--dt", type=float, default=1.0 / cfg["loop"]["tick_rate"])
+    ap.add_argument("--instances", type=int, default=1)
+    ap.add_argument("--processes", type=int, default=None, help="pool size (default: CPU count)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--draw", action="store_true", help="also draw to an offscreen surface")
+    ap.add_argument("--replay", default=None, help="input log to drive the scene with (sets dt and seed)")
+    args = ap.parse_args(argv)
+    ticks = args.ticks if args.ticks is not None or args.replay else 3600
+
+    results = run_many(args.scene, args.instances, ticks, args.dt,
+                       args.processes, args.seed, args.draw, args.replay)
+    for r in results:
+        print(f"seed {r['seed']:>4}: {r['ticks']} ticks in {r['wall_seconds']:.3f}s "
+              f"-> {r['ticks_per_sec']:.0f} ticks/s ({r['realtime_factor']:.1f}x real time)")
+        if "frame_ms" in r:
+            print("      frame ms: " + "  ".join(f"{k} {v:.3f}" for k, v in r["frame_ms"].items()))
+    if len(results) > 1:
+        total = sum(r["ticks"] for r in results)
+        wall = max(r["wall_seconds"] for r in results)
+        print(f"total: {total} ticks, aggregate {total / wall:.0f} ticks/s")
+    return results
+
+if __name__ == "__main__":
+    main()
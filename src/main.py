@@ -8,47 +8,68 @@ import sys
 import pathlib
 import pygame as pg
 from engine.boot.guard import enforce_input_contract
+from engine.boot.config import load_config
 from engine.scene.manager import SceneManager
 from engine.scenes.splash_scene import SplashScene
 from engine.display.scaler import Scaler
 from engine.debug.profiler import ProfilerOverlay
+from engine.loop.stepper import FixedStepper
+from engine.render import fonts
+from engine.assets.manager import AssetManager
+from src import audio
 
 def main():
     enforce_input_contract("alpha_engine.toml")
+    cfg = load_config("alpha_engine.toml")
     pg.init()
     pg.display.set_caption("SWPC AI Engine — Demo")
 
     scaler = Scaler("alpha_engine.toml")
     window = scaler.create_window()
+    fonts.prewarm()  # scenes and overlays then only look fonts up
+    assets = AssetManager.from_config(cfg)
+    audio.configure(cfg, assets)
     clock = pg.time.Clock()
     prof = ProfilerOverlay()
+    stepper = FixedStepper.from_config(cfg)  # None = variable dt
+    fps_cap = cfg["loop"]["fps_cap"]
 
-    sm = SceneManager()
+    sm = SceneManager(assets)
     sm.push(SplashScene(next_scene_factory=lambda: None))
 
     running = True
     while running:
-        dt = clock.tick(60) / 1000.0  # Delta time in seconds
+        dt = clock.tick(fps_cap) / 1000.0  # Frame time in seconds
+        audio.update(dt)
 
         for e in pg.event.get():
             if e.type == pg.QUIT:
                 running = False
             elif e.type == pg.VIDEORESIZE:
                 scaler.on_resize(e.w, e.h)
+            elif e.type == pg.WINDOWEXPOSED:
+                scaler.mark_dirty(None)  # restored/uncovered window: present the whole frame
             if hasattr(e, 'pos'):
-                lp = scaler.window_to_logical(e.pos)
-                if lp is not None:
-                    e = pg.event.Event(
-                        e.type,
-                        {**e.dict, 'pos': lp, 'button': getattr(e, 'button', 0)}
-                    )
+                # Clamped, so clicks/releases on the letterbox bars still arrive in logical space
+                lp = scaler.window_to_logical(e.pos, clamp=True)
+                e = pg.event.Event(
+                    e.type,
+                    {**e.dict, 'pos': lp, 'button': getattr(e, 'button', 0)}
+                )
             sm.handle_event(e)
 
-        sm.update(dt)
+        if stepper is not None:
+            for _ in range(stepper.advance(dt)):
+                sm.update(stepper.step)
+            alpha = stepper.alpha
+        else:
+            sm.update(dt)
+            alpha = 1.0
+
         surf = scaler.begin()
-        sm.draw(surf)
+        scaler.mark_dirty(sm.draw(surf, alpha))
         prof.tick(dt)
-        prof.draw(surf)
+        scaler.mark_dirty(prof.draw(surf))
         scaler.end()
 
     pg.quit()
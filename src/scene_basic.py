@@ -1,16 +1,35 @@
 # src/scene_basic.py
 
+import random
 import pygame as pg
+from engine.render.fonts import get_font
+from engine.render.text_cache import render_text
+from src.entities.entity import Entity
+from src.entities.entity_manager import EntityManager
 
 class BasicScene:
     """
     A simple example scene for Sotoworks Alpha 1.
     Override handle_event, update, and draw for your game logic.
+
+    A few bouncing entities show fixed-step render interpolation: with
+    interpolate = True the SceneManager passes the stepper's alpha to draw().
     """
-    def __init__(self):
+    interpolate = True
+
+    def __init__(self, bounce_count=6):
         self.bg_color = (30, 30, 40)
         self.message = "Hello, Sotoworks!"
-        self.font = pg.font.SysFont('Consolas', 32)
+        self.font = get_font("Consolas", 32)
+        self.bounds = pg.Rect(0, 0, 480, 320)  # follows the surface drawn to
+        self.entities = EntityManager()
+        rng = random.Random(1)
+        for _ in range(bounce_count):
+            img = pg.Surface((12, 12))
+            img.fill((rng.randrange(80, 256), rng.randrange(80, 256), 120))
+            e = Entity((rng.uniform(0, 460), rng.uniform(0, 300)), img, size=(12, 12))
+            e.vel = pg.Vector2(rng.uniform(-120, 120), rng.uniform(-120, 120))
+            self.entities.add(e)
 
     def handle_event(self, event):
         # Example: Exit on Escape key
@@ -20,10 +39,19 @@ class BasicScene:
 
     def update(self, dt):
         # Update logic (animations, timers, etc)
-        pass
+        self.entities.update(dt)
+        b = self.bounds
+        for e in self.entities.entities:
+            vel = e.vel
+            if (e.rect.left < b.left and vel.x < 0) or (e.rect.right > b.right and vel.x > 0):
+                vel.x = -vel.x
+            if (e.rect.top < b.top and vel.y < 0) or (e.rect.bottom > b.bottom and vel.y > 0):
+                vel.y = -vel.y
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
+        self.bounds = surface.get_rect()
         surface.fill(self.bg_color)
-        text = self.font.render(self.message, True, (180, 220, 255))
+        self.entities.draw(surface, alpha=alpha)
+        text = render_text(self.font, self.message, True, (180, 220, 255))
         rect = text.get_rect(center=surface.get_rect().center)
         surface.blit(text, rect)
@@ -1,22 +1,40 @@
 import pygame as pg
+from engine.render.fonts import get_font
+from engine.render.text_cache import render_text
+from engine.scene.layers import LayerStack
 from src.achievements import ACHIEVEMENTS
 
 class AchievementsScene:
     def __init__(self, screen):
         self.screen = screen
-        self.font = pg.font.SysFont("Consolas", 28)
+        self.font = get_font("Consolas", 28)
+        self.layers = LayerStack(screen.get_size())
+        self.layers.add("list", self._paint_list)
+        self.dirty = True  # static screen: draw once, then report no change
 
     def handle_event(self, event):
         pass
 
+    def invalidate(self):
+        # Achievements may have unlocked while another scene was on top
+        self.layers.invalidate("list")
+        self.dirty = True
+
     def update(self, dt):
         pass
 
-    def draw(self):
-        self.screen.fill((20, 20, 20))
+    def _paint_list(self, surf):
+        surf.fill((20, 20, 20))
         y = 60
         for ach in ACHIEVEMENTS:
             col = (120,255,120) if ach["unlocked"] else (100,100,100)
-            label = self.font.render(f"{ach['desc']}", True, col)
-            self.screen.blit(label, (60, y))
+            label = render_text(self.font, f"{ach['desc']}", True, col)
+            surf.blit(label, (60, y))
             y += 40
+
+    def draw(self):
+        if not self.dirty:
+            return []
+        self.dirty = False
+        self.layers.draw(self.screen)
+        return None  # whole screen repainted
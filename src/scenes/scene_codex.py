@@ -1,11 +1,22 @@
 import pygame as pg
+from engine.render.fonts import get_font
+from engine.render.text_cache import render_text
+from engine.scene.layers import LayerStack
 from src.codex import CODEX_ENTRIES
 
+BG = (0, 0, 30)
+SELECTED_COLOR = (180,250,120)
+
 class CodexScene:
     def __init__(self, screen):
         self.screen = screen
-        self.font = pg.font.SysFont("Consolas", 28)
+        self.font = get_font("Consolas", 28)
         self.entry_index = 0
+        self.entry_rows = {}  # entry index -> topleft, unlocked entries only
+        self.layers = LayerStack(screen.get_size())
+        self.layers.add("entries", self._paint_entries)
+        self.dirty = True
+        self.shown_index = None
 
     def handle_event(self, event):
         if event.type == pg.KEYDOWN:
@@ -14,15 +25,51 @@ class CodexScene:
             if event.key == pg.K_UP:
                 self.entry_index = (self.entry_index - 1) % len(CODEX_ENTRIES)
 
+    def invalidate(self):
+        # Entries may have been unlocked while another scene was on top
+        self.layers.invalidate("entries")
+        self.dirty = True
+
     def update(self, dt):
         pass
 
-    def draw(self):
-        self.screen.fill((0, 0, 30))
+    def _paint_entries(self, surf):
+        surf.fill(BG)
         y = 40
+        self.entry_rows = {}
         for i, entry in enumerate(CODEX_ENTRIES):
             if entry["unlocked"]:
-                col = (180,250,120) if i == self.entry_index else (120,180,120)
-                label = self.font.render(f"{entry['title']}", True, col)
-                self.screen.blit(label, (40, y))
+                label = render_text(self.font, f"{entry['title']}", True, (120,180,120))
+                surf.blit(label, (40, y))
+                self.entry_rows[i] = (40, y)
                 y += 36
+
+    def _row_rect(self, i):
+        x, y = self.entry_rows[i]
+        return pg.Rect(x, y, self.screen.get_width() - x, self.font.get_linesize())
+
+    def _draw_highlight(self):
+        self.shown_index = self.entry_index
+        if self.entry_index not in self.entry_rows:
+            return None  # locked entry: nothing to highlight
+        rect = self._row_rect(self.entry_index)
+        self.screen.fill(BG, rect)
+        title = CODEX_ENTRIES[self.entry_index]["title"]
+        self.screen.blit(render_text(self.font, f"{title}", True, SELECTED_COLOR), rect.topleft)
+        return rect
+
+    def draw(self):
+        if self.dirty:
+            self.dirty = False
+            self.layers.draw(self.screen)
+            self._draw_highlight()
+            return None  # whole screen repainted
+        if self.shown_index == self.entry_index:
+            return []
+        rects = []
+        if self.shown_index in self.entry_rows:
+            rects.append(self.layers.draw(self.screen, self._row_rect(self.shown_index)))
+        new = self._draw_highlight()
+        if new is not None:
+            rects.append(new)
+        return rects
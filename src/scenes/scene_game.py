@@ -1,10 +1,12 @@
 import pygame as pg
+from engine.render.fonts import get_font
+from engine.render.text_cache import render_text
 from engine.player import Player
 
 class GameScene:
     def __init__(self, screen):
         self.screen = screen
-        self.font = pg.font.SysFont("Consolas", 32)
+        self.font = get_font("Consolas", 32)
         self.player = Player(100, 100)
 
     def handle_event(self, event):
@@ -17,5 +19,5 @@ class GameScene:
     def draw(self):
         self.screen.fill((20, 20, 30))
         self.player.draw(self.screen)
-        label = self.font.render("Use WASD or arrow keys to move!", True, (255,255,255))
+        label = render_text(self.font, "Use WASD or arrow keys to move!", True, (255,255,255))
         self.screen.blit(label, (50, 30))
@@ -1,14 +1,29 @@
 import pygame as pg
+from engine.render.fonts import get_font
+from engine.render.text_cache import render_text
+from engine.scene.layers import LayerStack
 from src.player_stats import PLAYER_STATS
 from src.levels import LEVELS
 from src.master_unlock_grid import MASTER_UNLOCK_GRID
 
+BG = (30, 30, 40)
+ROW_COLOR = (200,200,200)
+SELECTED_COLOR = (255,220,120)
+
 class MenuScene:
     def __init__(self, screen):
         self.screen = screen
-        self.font = pg.font.SysFont("Consolas", 32)
+        self.font = get_font("Consolas", 32)
         self.level_index = 0
         self.message = ""
+        self.stats_text = self._stats_text()
+        self.level_rows = []  # level index -> topleft of its label, filled by _paint_page
+        # Everything but the highlighted row is retained; only the highlight is redrawn
+        self.layers = LayerStack(screen.get_size())
+        self.layers.add("page", self._paint_page)
+        self.layers.add("message", self._paint_message, alpha=True)
+        self.dirty = True  # full repaint on the next draw()
+        self.shown_index = None  # row currently highlighted on screen
 
     def handle_event(self, event):
         if event.type == pg.KEYDOWN:
@@ -18,31 +33,71 @@ class MenuScene:
                 self.level_index = (self.level_index - 1) % len(LEVELS)
             if event.key == pg.K_RETURN:
                 self.message = f"Selected {LEVELS[self.level_index]['name']}"
+                self.layers.invalidate("message")
+                self.dirty = True
+
+    def invalidate(self):
+        self.stats_text = self._stats_text()  # stats may have changed while covered
+        self.layers.invalidate("page")
+        self.dirty = True
+
+    @staticmethod
+    def _stats_text():
+        return " | ".join([f"{k}: {v}" for k, v in PLAYER_STATS.items()])
 
     def update(self, dt):
         pass
 
-    def draw(self):
-        self.screen.fill((30, 30, 40))
+    def _paint_page(self, surf):
+        surf.fill(BG)
         y = 50
-        stats_text = " | ".join([f"{k}: {v}" for k, v in PLAYER_STATS.items()])
-        self.screen.blit(self.font.render(stats_text, True, (180,220,180)), (20, y))
+        surf.blit(render_text(self.font, self.stats_text, True, (180,220,180)), (20, y))
         y += 60
-        self.screen.blit(self.font.render("Levels:", True, (200,200,220)), (20, y))
+        surf.blit(render_text(self.font, "Levels:", True, (200,200,220)), (20, y))
         y += 40
-        for i, lvl in enumerate(LEVELS):
-            col = (255,220,120) if i == self.level_index else (200,200,200)
-            label = self.font.render(f"{lvl['id']} - {lvl['name']}", True, col)
-            self.screen.blit(label, (40, y))
+        self.level_rows = []
+        for lvl in LEVELS:
+            surf.blit(render_text(self.font, self._level_label(lvl), True, ROW_COLOR), (40, y))
+            self.level_rows.append((40, y))
             y += 40
         y += 40
-        self.screen.blit(self.font.render("Unlocked Features:", True, (200,220,200)), (20, y))
+        surf.blit(render_text(self.font, "Unlocked Features:", True, (200,220,200)), (20, y))
         y += 40
         for unlock in MASTER_UNLOCK_GRID:
             if unlock.get("unlocked"):
-                label = self.font.render(f"{unlock['unlock']} - {unlock['reward']}", True, (160,255,160))
-                self.screen.blit(label, (40, y))
+                label = render_text(self.font, f"{unlock['unlock']} - {unlock['reward']}", True, (160,255,160))
+                surf.blit(label, (40, y))
                 y += 36
+
+    def _paint_message(self, surf):
         if self.message:
-            msg_label = self.font.render(self.message, True, (255,100,100))
-            self.screen.blit(msg_label, (20, self.screen.get_height()-60))
+            msg_label = render_text(self.font, self.message, True, (255,100,100))
+            surf.blit(msg_label, (20, surf.get_height()-60))
+
+    @staticmethod
+    def _level_label(lvl):
+        return f"{lvl['id']} - {lvl['name']}"
+
+    def _row_rect(self, i):
+        x, y = self.level_rows[i]
+        return pg.Rect(x, y, self.screen.get_width() - x, self.font.get_linesize())
+
+    def _draw_highlight(self):
+        rect = self._row_rect(self.level_index)
+        self.screen.fill(BG, rect)
+        label = render_text(self.font, self._level_label(LEVELS[self.level_index]), True, SELECTED_COLOR)
+        self.screen.blit(label, rect.topleft)
+        self.shown_index = self.level_index
+        return rect
+
+    def draw(self):
+        if self.dirty:
+            self.dirty = False
+            self.layers.draw(self.screen)
+            self._draw_highlight()
+            return None  # whole screen repainted
+        if self.shown_index == self.level_index:
+            return []
+        # Selection moved: restore the old row from the cached layers, highlight the new one
+        old = self.layers.draw(self.screen, self._row_rect(self.shown_index))
+        return [old, self._draw_highlight()]
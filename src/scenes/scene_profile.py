@@ -1,28 +1,67 @@
 import pygame as pg
+from engine.render.fonts import get_font
+from engine.render.text_cache import render_text
+from engine.scene.layers import LayerStack
 from src.profiles import list_profiles
 
+BG = (10, 10, 20)
+SELECTED_COLOR = (255,200,100)
+
 class ProfileScene:
     def __init__(self, screen):
         self.screen = screen
-        self.font = pg.font.SysFont("Consolas", 28)
+        self.font = get_font("Consolas", 28)
         self.profiles = list_profiles()
         self.profile_index = 0
+        self.layers = LayerStack(screen.get_size())
+        self.layers.add("profiles", self._paint_profiles)
+        self.dirty = True
+        self.shown_index = -1  # row highlighted on screen, -1 = none
 
     def handle_event(self, event):
-        if event.type == pg.KEYDOWN:
+        if event.type == pg.KEYDOWN and self.profiles:
             if event.key == pg.K_DOWN:
                 self.profile_index = (self.profile_index + 1) % len(self.profiles)
             if event.key == pg.K_UP:
                 self.profile_index = (self.profile_index - 1) % len(self.profiles)
 
+    def invalidate(self):
+        # Profiles may have been created or deleted while another scene was on top
+        self.profiles = list_profiles()
+        self.profile_index = min(self.profile_index, max(0, len(self.profiles) - 1))
+        self.layers.invalidate()
+        self.dirty = True
+
     def update(self, dt):
         pass
 
-    def draw(self):
-        self.screen.fill((10, 10, 20))
+    def _paint_profiles(self, surf):
+        surf.fill(BG)
         y = 60
-        for i, p in enumerate(self.profiles):
-            col = (255,200,100) if i == self.profile_index else (180,180,180)
-            label = self.font.render(p, True, col)
-            self.screen.blit(label, (60, y))
+        for p in self.profiles:
+            surf.blit(render_text(self.font, p, True, (180,180,180)), (60, y))
             y += 40
+
+    def _row_rect(self, i):
+        return pg.Rect(60, 60 + i * 40, self.screen.get_width() - 60, self.font.get_linesize())
+
+    def _draw_highlight(self):
+        if not self.profiles:
+            self.shown_index = -1
+            return None
+        rect = self._row_rect(self.profile_index)
+        self.screen.fill(BG, rect)
+        self.screen.blit(render_text(self.font, self.profiles[self.profile_index], True, SELECTED_COLOR), rect.topleft)
+        self.shown_index = self.profile_index
+        return rect
+
+    def draw(self):
+        if self.dirty:
+            self.dirty = False
+            self.layers.draw(self.screen)
+            self._draw_highlight()
+            return None  # whole screen repainted
+        if not self.profiles or self.shown_index == self.profile_index:
+            return []
+        old = self.layers.draw(self.screen, self._row_rect(self.shown_index))
+        return [old, self._draw_highlight()]
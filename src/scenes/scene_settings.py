@@ -1,19 +1,29 @@
 import pygame as pg
+from engine.render.fonts import get_font
+from engine.render.text_cache import render_text
 from src.settings import SETTINGS
 
 class SettingsScene:
     def __init__(self, screen):
         self.screen = screen
-        self.font = pg.font.SysFont("Consolas", 28)
+        self.font = get_font("Consolas", 28)
         self.message = "Settings (stub)"
+        self.dirty = True  # static screen: draw once, then report no change
 
     def handle_event(self, event):
         pass
 
+    def invalidate(self):
+        self.dirty = True
+
     def update(self, dt):
         pass
 
     def draw(self):
+        if not self.dirty:
+            return []
+        self.dirty = False
         self.screen.fill((20, 25, 35))
-        label = self.font.render(self.message, True, (200,200,255))
+        label = render_text(self.font, self.message, True, (200,200,255))
         self.screen.blit(label, (100, 100))
+        return None  # whole screen repainted
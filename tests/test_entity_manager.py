@@ -0,0 +1,45 @@
+# tests/test_entity_manager.py
+
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from entities import Bullet, Enemy, EntityPool
+from entities.entity_manager import EntityManager
+
+class _Sniper(Enemy):
+    """Kills a bullet during its own update, before the bullet's turn comes."""
+    def __init__(self, target):
+        super().__init__((0, 0))
+        self.target = target
+
+    def update(self, dt, game=None):
+        if self.target is not None:
+            self.target.kill()
+            self.target = None
+
+def test_bullet_refired_from_pool_in_same_frame_survives():
+    pool = EntityPool(Bullet)
+    em = EntityManager()
+    bullet = pool.acquire((10, 10), (100, 0))
+    sniper = _Sniper(None)
+    em.add(sniper)
+    em.add(bullet)
+    em.update(0.016)
+    sniper.target = bullet
+
+    # The bullet dies mid-loop and goes straight back to the pool...
+    em.update(0.016)
+    assert bullet.in_pool and bullet not in em.entities
+
+    # ...so the next shot this frame gets the same instance back
+    shot = pool.acquire((20, 20), (100, 0))
+    assert shot is bullet
+    em.add(shot)
+    em.update(0.016)
+    em.update(0.016)
+    assert shot.alive and not shot.in_pool
+    assert shot in em.entities
+    assert shot in em.get_by_tag("bullet")
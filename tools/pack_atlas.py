@@ -0,0 +1,160 @@
+# tools/pack_atlas.py
+"""
+Build-time texture atlas packer. Packs every image under a directory of assets/
+into atlas pages (MaxRects, best-short-side-fit) and writes the pages as PNGs plus
+a compact JSON index of frame rects that engine/assets/atlas.py loads at runtime.
+
+    python tools/pack_atlas.py assets/sprites assets/atlas/sprites --size 1024 --padding 1
+
+Frame names are paths relative to the source directory without extension, with
+forward slashes ("enemies/drone"). Index format:
+
+    {"pages": ["sprites_0.png", ...], "frames": {"enemies/drone": [page, x, y, w, h], ...}}
+"""
+
+import argparse
+import json
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame as pg
+
+IMAGE_EXTS = (".png", ".bmp", ".gif", ".jpg", ".jpeg", ".tga", ".webp")
+
+
+class MaxRectsBin:
+    """One page: free space kept as maximal free rectangles."""
+    def __init__(self, width, height):
+        self.width, self.height = width, height
+        self.free = [pg.Rect(0, 0, width, height)]
+        self.used = []
+
+    def insert(self, w, h):
+        """Place a w x h rect; returns its Rect, or None if it doesn't fit."""
+        best, best_score = None, None
+        for fr in self.free:
+            if fr.w >= w and fr.h >= h:
+                score = (min(fr.w - w, fr.h - h), max(fr.w - w, fr.h - h))
+                if best_score is None or score < best_score:
+                    best, best_score = pg.Rect(fr.x, fr.y, w, h), score
+        if best is None:
+            return None
+        self._split(best)
+        self.used.append(best)
+        return best
+
+    def _split(self, placed):
+        out = []
+        for fr in self.free:
+            if not fr.colliderect(placed):
+                out.append(fr)
+                continue
+            # Up to four maximal leftovers around the placed rect
+            if placed.left > fr.left:
+                out.append(pg.Rect(fr.left, fr.top, placed.left - fr.left, fr.h))
+            if placed.right < fr.right:
+                out.append(pg.Rect(placed.right, fr.top, fr.right - placed.right, fr.h))
+            if placed.top > fr.top:
+                out.append(pg.Rect(fr.left, fr.top, fr.w, placed.top - fr.top))
+            if placed.bottom < fr.bottom:
+                out.append(pg.Rect(fr.left, placed.bottom, fr.w, fr.bottom - placed.bottom))
+        # Drop rects contained in another one
+        out.sort(key=lambda r: r.w * r.h, reverse=True)
+        pruned = []
+        for r in out:
+            if not any(p.contains(r) for p in pruned):
+                pruned.append(r)
+        self.free = pruned
+
+    def extent(self):
+        """Smallest (w, h) covering everything placed."""
+        return (max((r.right for r in self.used), default=0),
+                max((r.bottom for r in self.used), default=0))
+
+
+def collect_images(src):
+    images = {}
+    for dirpath, dirs, files in os.walk(src):
+        dirs.sort()  # walk order is filesystem-dependent; keep the output reproducible
+        for name in sorted(files):
+            if name.lower().endswith(IMAGE_EXTS):
+                path = os.path.join(dirpath, name)
+                key = os.path.splitext(os.path.relpath(path, src))[0].replace(os.sep, "/")
+                images[key] = pg.image.load(path)
+    return images
+
+
+def pack(images, page_size=1024, padding=1):
+    """
+    Pack {name: Surface} into pages. Returns (bins, placements) where placements maps
+    name -> (page index, Rect without padding). Largest images go first.
+    """
+    order = sorted(images, key=lambda k: (max(images[k].get_size()), images[k].get_width() * images[k].get_height()),
+                   reverse=True)
+    bins, placements = [], {}
+    for name in order:
+        w, h = images[name].get_size()
+        pw, ph = w + padding, h + padding
+        if pw > page_size or ph > page_size:
+            raise ValueError(f"{name} ({w}x{h}) does not fit a {page_size}px page")
+        for i, b in enumerate(bins):
+            r = b.insert(pw, ph)
+            if r is not None:
+                break
+        else:
+            bins.append(MaxRectsBin(page_size, page_size))
+            i, r = len(bins) - 1, bins[-1].insert(pw, ph)
+        placements[name] = (i, pg.Rect(r.x, r.y, w, h))
+    return bins, placements
+
+
+def build(src, out_prefix, page_size=1024, padding=1):
+    t0 = time.perf_counter()
+    pg.display.init()
+    pg.display.set_mode((1, 1))
+    images = collect_images(src)
+    bins, placements = pack(images, page_size, padding)
+
+    out_dir, base = os.path.split(out_prefix)
+    os.makedirs(out_dir or ".", exist_ok=True)
+    pages, page_area = [], 0
+    for i, b in enumerate(bins):
+        w, h = b.extent()
+        page = pg.Surface((max(1, w), max(1, h)), pg.SRCALPHA)
+        page.fill((0, 0, 0, 0))
+        page.blits([(images[n], r.topleft) for n, (p, r) in placements.items() if p == i], False)
+        name = f"{base}_{i}.png"
+        pg.image.save(page, os.path.join(out_dir, name))
+        pages.append(name)
+        page_area += page.get_width() * page.get_height()
+
+    index = {"pages": pages, "frames": {n: [p, r.x, r.y, r.w, r.h] for n, (p, r) in sorted(placements.items())}}
+    with open(out_prefix + ".json", "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+
+    frame_area = sum(r.w * r.h for _, r in placements.values())
+    return {
+        "frames": len(placements),
+        "pages": len(pages),
+        "fill_ratio": frame_area / page_area if page_area else 0.0,
+        "seconds": time.perf_counter() - t0,
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Pack a directory of images into texture atlas pages")
+    ap.add_argument("src", help="directory of images, e.g. assets/sprites")
+    ap.add_argument("out", help="output prefix, e.g. assets/atlas/sprites (writes sprites_N.png + sprites.json)")
+    ap.add_argument("--size", type=int, default=1024, help="max page width/height in pixels")
+    ap.add_argument("--padding", type=int, default=1, help="gap between frames in pixels")
+    args = ap.parse_args(argv)
+    report = build(args.src, args.out, args.size, args.padding)
+    print(f"{report['frames']} frames -> {report['pages']} page(s), "
+          f"fill {report['fill_ratio']:.1%}, {report['seconds']:.2f}s")
+    return report
+
+if __name__ == "__main__":
+    main()